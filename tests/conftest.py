@@ -1,7 +1,176 @@
+import importlib
+import io
+import json
+import os
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
-if str(SRC) not in sys.path:
-    sys.path.insert(0, str(SRC))
+
+# Keep argparse from probing the terminal for colour support.
+os.environ.setdefault("NO_COLOR", "1")
+
+
+def pytest_configure(config):
+    """Put the project root and src/ on sys.path once, before collection."""
+    for path in (str(ROOT), str(SRC)):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Keep every subprocess-launching test on one xdist worker (--dist loadgroup)."""
+    for item in items:
+        if item.get_closest_marker("subprocess"):
+            item.add_marker(pytest.mark.xdist_group("cli_subproc"))
+
+
+def _fake_open_factory(payload):
+    """Build an ``open`` replacement that serves ``payload`` from memory."""
+    def _open(*args, **kwargs):
+        return io.StringIO(payload)
+    return _open
+
+
+@pytest.fixture(scope="session")
+def repo_root(pytestconfig):
+    """Repository root, for tests that launch a process from it."""
+    return str(pytestconfig.rootpath)
+
+
+@pytest.fixture
+def fake_open_factory():
+    """Factory for in-memory ``open`` replacements, cheaper than mock_open."""
+    return _fake_open_factory
+
+
+@pytest.fixture(scope="session")
+def registry():
+    """Single ExpertRegistry shared by read-only registry tests."""
+    from zenrube.experts.expert_registry import ExpertRegistry
+
+    return ExpertRegistry()
+
+
+@pytest.fixture(scope="session")
+def discovered_experts(registry):
+    """Result of one discover_experts() scan, shared by read-only tests."""
+    return registry.discover_experts()
+
+
+@pytest.fixture(scope="session")
+def data_cleaner_module():
+    """The data_cleaner expert module, imported once per session."""
+    return importlib.import_module("zenrube.experts.data_cleaner")
+
+
+@pytest.fixture(scope="module")
+def changelog_json():
+    """Three changelog entries in chronological order, pre-serialized."""
+    return json.dumps([
+        {
+            "timestamp": "2025-11-07T08:00:00.000Z",
+            "expert_name": "expert3",
+            "old_version": "3.0.0",
+            "new_version": "3.1.0",
+            "change_summary": "Update 3",
+            "author": "test@example.com"
+        },
+        {
+            "timestamp": "2025-11-07T09:00:00.000Z",
+            "expert_name": "expert2",
+            "old_version": "2.0.0",
+            "new_version": "2.1.0",
+            "change_summary": "Update 2",
+            "author": "dev@example.com"
+        },
+        {
+            "timestamp": "2025-11-07T10:00:00.000Z",
+            "expert_name": "expert1",
+            "old_version": "1.0.0",
+            "new_version": "1.1.0",
+            "change_summary": "Update 1",
+            "author": "test@example.com"
+        }
+    ])
+
+
+ZENRUBE_MODULES = (
+    "zenrube",
+    "zenrube.cli",
+    "zenrube.config",
+    "zenrube.experts",
+    "zenrube.experts.expert_registry",
+    "zenrube.experts.data_cleaner",
+    "zenrube.experts.semantic_router",
+    "zenrube.experts.summarizer",
+    "zenrube.experts.publisher",
+    "zenrube.experts.rube_adapter",
+    "zenrube.experts.version_manager",
+    "zenrube.experts.autopublisher",
+)
+
+
+@pytest.fixture(scope="session")
+def zenrube_modules():
+    """Core package modules keyed by dotted path, imported once per session."""
+    modules = {}
+    for name in ZENRUBE_MODULES:
+        try:
+            modules[name] = importlib.import_module(name)
+        except ImportError as e:
+            pytest.fail(f"Failed to import Zenrube module: {e}")
+    return modules
+
+
+@pytest.fixture(scope="session")
+def data_cleaner():
+    from zenrube.experts.data_cleaner import DataCleanerExpert
+
+    return DataCleanerExpert()
+
+
+@pytest.fixture(scope="session")
+def semantic_router():
+    from zenrube.experts.semantic_router import SemanticRouterExpert
+
+    return SemanticRouterExpert()
+
+
+@pytest.fixture(scope="session")
+def summarizer():
+    from zenrube.experts.summarizer import SummarizerExpert
+
+    return SummarizerExpert()
+
+
+@pytest.fixture(scope="session")
+def publisher():
+    from zenrube.experts.publisher import PublisherExpert
+
+    return PublisherExpert()
+
+
+@pytest.fixture(scope="session")
+def version_manager():
+    # Versions live in a module-level table, so sharing the instance adds no state.
+    from zenrube.experts.version_manager import VersionManagerExpert
+
+    return VersionManagerExpert()
+
+
+@pytest.fixture(scope="session")
+def rube_adapter():
+    from zenrube.experts.rube_adapter import RubeAdapterExpert
+
+    return RubeAdapterExpert()
+
+
+@pytest.fixture(scope="session")
+def autopublisher():
+    from zenrube.experts.autopublisher import AutoPublisherExpert
+
+    return AutoPublisherExpert()
@@ -1,5 +1,6 @@
 """Tests for ChatGPT FS Agent and FilesystemClient implementation."""
 
+import asyncio
 import os
 import tempfile
 import shutil
@@ -66,6 +67,23 @@ class TestMCPFilesystemClient:
         assert "error" in result
         assert "does not exist" in result["error"]
 
+    def test_list_directory_on_file(self):
+        """Test list_directory with a file path."""
+        result = self.client.list_directory(self.test_file)
+        
+        assert "error" in result
+        assert "is not a directory" in result["error"]
+
+    def test_list_directory_with_broken_symlink(self):
+        """Test a dangling symlink is listed instead of failing the listing."""
+        os.symlink(os.path.join(self.temp_dir, "gone.txt"), os.path.join(self.test_dir, "dangling"))
+
+        result = self.client.list_directory(self.test_dir)
+
+        items = {item["name"]: item for item in result["items"]}
+        assert set(items) == {"test.txt", "nested", "dangling"}
+        assert items["dangling"]["is_dir"] is False
+
     def test_read_text_file(self):
         """Test read_text_file functionality."""
         result = self.client.read_text_file(self.test_file)
@@ -83,6 +101,8 @@ class TestMCPFilesystemClient:
         assert result["ok"] is True
         assert result["lines_returned"] == 2
         assert "Line 3" not in result["content"]
+        # Reading stops after the head, so the total is unknown
+        assert result["lines_total"] is None
 
     def test_read_text_file_with_tail(self):
         """Test read_text_file with tail parameter."""
@@ -91,6 +111,46 @@ class TestMCPFilesystemClient:
         assert result["ok"] is True
         assert result["lines_returned"] == 2
         assert "Hello World" not in result["content"]
+        assert result["lines_total"] == 3
+
+    def test_read_text_file_with_head_and_tail(self):
+        """Test read_text_file takes the tail of the head."""
+        result = self.client.read_text_file(self.test_file, head=2, tail=1)
+        
+        assert result["ok"] is True
+        assert result["lines_returned"] == 1
+        assert result["content"] == "Line 2\n"
+
+    def test_read_text_file_without_trailing_newline(self):
+        """Test full read counts a final unterminated line."""
+        path = os.path.join(self.temp_dir, "no_newline.txt")
+        with open(path, 'w') as f:
+            f.write("first\nsecond")
+
+        result = self.client.read_text_file(path)
+
+        assert result["content"] == "first\nsecond"
+        assert result["lines_total"] == 2
+        assert result["lines_returned"] == 2
+
+    def test_read_text_file_tail_of_large_file(self):
+        """Test tail reads of mapped files match the text-mode result."""
+        lines = [f"line {i} {'x' * 60}\n" for i in range(40000)]
+        path = os.path.join(self.temp_dir, "large.txt")
+        crlf_path = os.path.join(self.temp_dir, "large_crlf.txt")
+        with open(path, 'w', newline='') as f:
+            f.writelines(lines + ["last"])
+        with open(crlf_path, 'w', newline='') as f:
+            f.writelines(line.replace("\n", "\r\n") for line in lines)
+
+        result = self.client.read_text_file(path, tail=3)
+        crlf_result = self.client.read_text_file(crlf_path, tail=2)
+
+        assert result["content"] == "".join(lines[-2:]) + "last"
+        assert result["lines_total"] == 40001
+        assert result["lines_returned"] == 3
+        assert crlf_result["content"] == "".join(lines[-2:])
+        assert crlf_result["lines_total"] == 40000
 
     def test_read_text_file_nonexistent(self):
         """Test read_text_file with non-existent file."""
@@ -99,6 +159,23 @@ class TestMCPFilesystemClient:
         assert "error" in result
         assert "does not exist" in result["error"]
 
+    def test_read_text_file_on_directory(self):
+        """Test read_text_file pointed at a directory."""
+        result = self.client.read_text_file(self.nested_dir)
+
+        assert "error" in result
+        assert "is not a file" in result["error"]
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires os.mkfifo")
+    def test_read_text_file_on_fifo(self):
+        """Test read_text_file rejects a FIFO instead of blocking on it."""
+        fifo = os.path.join(self.temp_dir, "pipe")
+        os.mkfifo(fifo)
+
+        result = self.client.read_text_file(fifo)
+
+        assert "is not a file" in result["error"]
+
     def test_write_text_file_new(self):
         """Test write_text_file creating new file."""
         new_file = os.path.join(self.temp_dir, "new_file.txt")
@@ -143,6 +220,24 @@ class TestMCPFilesystemClient:
         assert result["ok"] is True
         assert os.path.exists(new_file)
 
+    def test_write_text_file_recreates_removed_directory(self, monkeypatch):
+        """Test parent directories are created once and recreated if removed."""
+        made = []
+        makedirs = os.makedirs
+        monkeypatch.setattr(os, "makedirs", lambda d, **kw: made.append(d) or makedirs(d, **kw))
+        new_dir = os.path.join(self.temp_dir, "new")
+        
+        assert self.client.write_text_file(os.path.join(new_dir, "a.txt"), "a")["ok"] is True
+        assert self.client.write_text_file(os.path.join(new_dir, "b.txt"), "b")["ok"] is True
+        assert made == [new_dir]
+        
+        # Removed through the client, then behind its back
+        assert self.client.delete_path(new_dir)["ok"] is True
+        assert self.client.write_text_file(os.path.join(new_dir, "c.txt"), "c")["ok"] is True
+        shutil.rmtree(new_dir)
+        assert self.client.write_text_file(os.path.join(new_dir, "d.txt"), "d")["ok"] is True
+        assert os.path.exists(os.path.join(new_dir, "d.txt"))
+
     def test_delete_path_file(self):
         """Test delete_path for file deletion."""
         result = self.client.delete_path(self.test_file)
@@ -159,6 +254,30 @@ class TestMCPFilesystemClient:
         assert result["action"] == "directory_deleted"
         assert not os.path.exists(self.nested_dir)
 
+    def test_delete_path_directory_without_unlink(self, monkeypatch):
+        """Test directories go to rmtree without trying unlink first."""
+        def unlink_refused(path):
+            # macOS/BSD and Windows refuse unlink on a directory this way
+            raise PermissionError(1, "Operation not permitted", path)
+
+        monkeypatch.setattr(os, "remove", unlink_refused)
+
+        result = self.client.delete_path(self.nested_dir)
+
+        assert result["action"] == "directory_deleted"
+        assert not os.path.exists(self.nested_dir)
+
+    def test_delete_path_symlink_to_directory(self):
+        """Test delete_path removes a directory symlink, not its target."""
+        link = os.path.join(self.temp_dir, "link")
+        os.symlink(self.nested_dir, link)
+
+        result = self.client.delete_path(link)
+
+        assert result["action"] == "file_deleted"
+        assert not os.path.lexists(link)
+        assert os.path.exists(self.nested_file)
+
     def test_delete_path_nonexistent(self):
         """Test delete_path with non-existent path."""
         result = self.client.delete_path("/nonexistent/path")
@@ -187,6 +306,16 @@ class TestMCPFilesystemClient:
         assert not os.path.exists(self.nested_dir)
         assert os.path.exists(dest)
 
+    def test_move_path_into_new_directory(self):
+        """Test move_path creates the destination's parent directory."""
+        dest = os.path.join(self.temp_dir, "archive", "2024", "moved_file.txt")
+
+        result = self.client.move_path(self.test_file, dest)
+
+        assert result["ok"] is True
+        assert not os.path.exists(self.test_file)
+        assert os.path.exists(dest)
+
     def test_move_path_dest_exists(self):
         """Test move_path when destination already exists."""
         dest = os.path.join(self.temp_dir, "existing_file.txt")
@@ -207,6 +336,15 @@ class TestMCPFilesystemClient:
         assert "error" in result
         assert "does not exist" in result["error"]
 
+    def test_move_path_nonexistent_src_leaves_dest_untouched(self):
+        """Test a failed move does not create the destination's parent."""
+        dest = os.path.join(self.temp_dir, "archive", "moved.txt")
+
+        result = self.client.move_path(os.path.join(self.temp_dir, "gone.txt"), dest)
+
+        assert "does not exist" in result["error"]
+        assert not os.path.exists(os.path.dirname(dest))
+
 
 class TestChatGPTFsAgent:
     """Test the ChatGPTFsAgent with safety features."""
@@ -252,6 +390,26 @@ class TestChatGPTFsAgent:
         with pytest.raises(ValueError, match="Path escapes root sandbox"):
             self.agent._normalize_path("/etc/passwd")
 
+    def test_normalize_path_allows_dots_inside_root(self):
+        """Test that '..' inside a name or resolving within root is allowed."""
+        assert self.agent._normalize_path("notes..txt") == os.path.join(self.temp_dir, "notes..txt")
+        assert self.agent._normalize_path("sub/../test.txt") == self.test_file
+
+    def test_normalize_path_sibling_prefix_blocked(self):
+        """Test that a sibling directory sharing the root's prefix is blocked."""
+        with pytest.raises(ValueError, match="Path escapes root sandbox"):
+            self.agent._normalize_path(self.temp_dir + "_evil/file.txt")
+
+    def test_normalize_path_symlink_escape_blocked(self):
+        """Test that a symlink pointing outside the root is blocked."""
+        outside = tempfile.mkdtemp()
+        try:
+            os.symlink(outside, os.path.join(self.temp_dir, "link"))
+            with pytest.raises(ValueError, match="Path escapes root sandbox"):
+                self.agent._normalize_path("link/secret.txt")
+        finally:
+            shutil.rmtree(outside)
+
     def test_check_op_allowed_delete_disabled(self):
         """Test that delete operations are blocked when disabled."""
         task = FsTask(op="delete", path="test.txt")
@@ -383,6 +541,111 @@ class TestChatGPTFsAgent:
         assert result["tasks"][0]["ok"] is True  # First task succeeded
         assert result["errors"][0]["task"]["path"] == "nonexistent.txt"  # Second task failed
 
+    def test_handle_plan_async_prefetches_reads(self):
+        """Test that read targets are prefetched before the async plan runs."""
+        prefetched = []
+        self.client.prefetch = prefetched.append
+        tasks = [
+            {"op": "read", "path": "test.txt"},
+            {"op": "write", "path": "new_file.txt", "content": "New content"},
+            {"op": "read", "path": "../outside.txt"},
+            {"op": "read", "path": "nonexistent.txt"},
+        ]
+        
+        result = asyncio.run(self.agent.handle_plan_async(tasks))
+        
+        assert prefetched == [[
+            os.path.join(self.temp_dir, "test.txt"),
+            os.path.join(self.temp_dir, "nonexistent.txt"),
+        ]]
+        assert len(result["tasks"]) == 2
+        assert len(result["errors"]) == 2
+
+    def test_handle_plan_does_not_prefetch(self):
+        """Test that the synchronous runner reads without readahead hints."""
+        self.client.prefetch = lambda paths: pytest.fail("prefetch called")
+        tasks = [
+            {"op": "read", "path": "test.txt"},
+            {"op": "read", "path": "test.txt"},
+        ]
+
+        assert self.agent.handle_plan(tasks)["ok"] is True
+
+    def test_handle_plan_resolves_each_path_once(self, monkeypatch):
+        """Test that repeated paths in a plan are resolved once, until a move."""
+        from zenrube.experts import chatgpt_fs_agent
+
+        resolved = []
+        realpath = os.path.realpath
+        monkeypatch.setattr(
+            chatgpt_fs_agent.os.path, "realpath", lambda p: resolved.append(p) or realpath(p)
+        )
+        tasks = [
+            {"op": "read", "path": "test.txt"},
+            {"op": "read", "path": "test.txt"},
+            {"op": "write", "path": "test.txt", "content": "Updated"},
+            {"op": "move", "path": "test.txt", "dest_path": "moved.txt"},
+            {"op": "read", "path": "moved.txt"},
+        ]
+        
+        result = self.agent.handle_plan(tasks)
+        
+        assert result["ok"] is True
+        assert [os.path.basename(p) for p in resolved] == ["test.txt", "moved.txt", "moved.txt"]
+
+    def test_prefetch_ignores_missing_paths(self):
+        """Test that prefetch is advisory and never raises."""
+        MCPFilesystemClient().prefetch([self.test_file, "/nonexistent/file.txt"])
+
+    @pytest.mark.skipif(
+        not hasattr(os, "posix_fadvise"), reason="requires os.posix_fadvise"
+    )
+    def test_prefetch_hints_only_large_files(self, monkeypatch):
+        """Test that small files are skipped without being opened."""
+        large = os.path.join(self.temp_dir, "large.bin")
+        with open(large, "wb") as f:
+            f.truncate(2 << 20)
+        opened = []
+        real_open = os.open
+
+        def recording_open(path, *args):
+            opened.append(path)
+            return real_open(path, *args)
+
+        monkeypatch.setattr(os, "open", recording_open)
+
+        MCPFilesystemClient().prefetch([self.test_file, large])
+
+        assert opened == [large]
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires os.mkfifo")
+    def test_prefetch_skips_fifo(self):
+        """Test that prefetch returns instead of blocking on a FIFO."""
+        fifo = os.path.join(self.temp_dir, "pipe")
+        os.mkfifo(fifo)
+
+        MCPFilesystemClient().prefetch([fifo, self.test_file])
+
+    def test_handle_plan_async_matches_sync(self):
+        """Test the async plan runner keeps plan order and mutation effects."""
+        tasks = [
+            {"op": "read", "path": "test.txt"},
+            {"op": "list", "path": "."},
+            {"op": "write", "path": "test.txt", "content": "Rewritten"},
+            {"op": "read", "path": "test.txt"},
+            {"op": "read", "path": "nonexistent.txt"},
+            {"op": "bogus", "path": "test.txt"},
+        ]
+        
+        result = asyncio.run(self.agent.handle_plan_async(tasks, {"source": "test"}))
+        
+        assert [t["op"] for t in result["tasks"]] == ["read", "list", "write", "read"]
+        assert result["tasks"][0]["result"]["content"] == "Test content"
+        assert result["tasks"][3]["result"]["content"] == "Rewritten"
+        assert [e["task"]["path"] for e in result["errors"]] == ["nonexistent.txt", "test.txt"]
+        assert result["ok"] is False
+        assert result["meta"] == {"source": "test"}
+
     def test_handle_plan_with_plan_meta(self):
         """Test plan execution with metadata."""
         tasks = [{"op": "read", "path": "test.txt"}]
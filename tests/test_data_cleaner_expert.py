@@ -65,3 +65,45 @@ class TestDataCleanerExpert:
         # None input
         result_none = expert.run(None)
         assert result_none is None
+
+    def test_non_printable_characters_are_removed(self):
+        expert = DataCleanerExpert()
+        # Control characters and non-ASCII are dropped; tabs and newlines stay
+        assert expert.run("café\x00 ok\x07\tdone ") == "Caf ok\tdone"
+        assert expert.run([" \x1bred", "grün "]) == ["Red", "Grn"]
+        assert expert.run({"k": "\x7fväl"}) == {"k": "Vl"}
+
+    def test_json_string_is_parsed_once(self, monkeypatch):
+        from zenrube.experts import data_cleaner
+
+        parsed = []
+        original = data_cleaner._loads
+        monkeypatch.setattr(data_cleaner, "_loads", lambda text: parsed.append(text) or original(text))
+        expert = DataCleanerExpert()
+
+        assert expert.run('{"name": " Vlad "}') == '{\n  "name": "Vlad"\n}'
+        assert len(parsed) == 1
+        # Plain text that cannot start a JSON document is never parsed
+        assert expert.run("hello, world") == "Hello, world"
+        assert len(parsed) == 1
+
+    def test_clean_csv_string_matches_row_list(self):
+        expert = DataCleanerExpert()
+        rows = [[" a ", "\x01b"], [" a ", "b"], ["x\ny", " ", "c"]]
+        # Control characters are filtered per cell; quoted newlines survive
+        assert expert.run(' a ,\x01b\n a ,b\n"x\ny", ,c\n') == 'A,B\r\n"X\ny",C\r\n'
+        assert expert.run(rows) == [["A", "B"], ["X\ny", "C"]]
+
+    def test_clean_json_handles_deep_nesting(self):
+        expert = DataCleanerExpert()
+        data = leaf = {}
+        for _ in range(5000):
+            leaf["child"] = {"name": " x ", "empty": ""}
+            leaf = leaf["child"]
+
+        cleaned = expert.run(data)
+
+        for _ in range(5000):
+            cleaned = cleaned["child"]
+            assert cleaned["name"] == "X"
+            assert "empty" not in cleaned
@@ -0,0 +1,201 @@
+"""Tests for the FS-Agent autonomous loop."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from zenrube.agent_runtime import fs_loop
+from zenrube.agent_runtime.fs_loop import FsAgentLoop
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    """A small workspace root with one file in it."""
+    (tmp_path / "notes.txt").write_text("hello\n")
+    return tmp_path
+
+
+def _scripted_planner(monkeypatch, plans):
+    """Replace the planner with one that replays ``plans`` in order."""
+    replay = iter(plans)
+    observations = []
+
+    def fake_planner(goal, observation, observation_json=None):
+        observations.append(observation)
+        return next(replay)
+
+    monkeypatch.setattr(fs_loop, "call_fs_planner_llm", fake_planner)
+    # Any non-dummy client keeps the loop from short-circuiting
+    monkeypatch.setattr(fs_loop, "get_llm_client", object)
+    return observations
+
+
+def _fake_llm(monkeypatch, content):
+    """Make the planner LLM client answer every prompt with ``content``."""
+    response = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+    )
+    client = SimpleNamespace(chat=SimpleNamespace(complete=lambda **kwargs: response))
+    monkeypatch.setattr(fs_loop, "get_llm_client", lambda: client)
+
+
+class TestFsAgentLoop:
+    """Test FsAgentLoop.run against a scripted planner."""
+
+    def test_stops_when_planner_returns_no_tasks(self, monkeypatch, workspace):
+        _scripted_planner(monkeypatch, [{"tasks": [], "meta": {"reason": "done"}}])
+
+        result = FsAgentLoop(root=str(workspace)).run("nothing to do")
+
+        assert result["ok"] is True
+        assert result["steps"] == 1
+        assert result["final_state"] == {"note": "Planner returned no tasks"}
+        assert result["history"][0]["execution"]["note"] == "No tasks returned"
+
+    def test_execution_feeds_next_observation(self, monkeypatch, workspace):
+        read = {"op": "read", "path": "notes.txt"}
+        observations = _scripted_planner(
+            monkeypatch, [{"tasks": [read]}, {"tasks": []}]
+        )
+
+        result = FsAgentLoop(root=str(workspace)).run("read the notes")
+
+        assert result["ok"] is True
+        assert result["steps"] == 2
+        assert observations[0] == {}
+        assert observations[1] is result["history"][0]["execution"]
+        assert observations[1]["ok"] is True
+
+    def test_disabled_planner_returns_without_looping(self, monkeypatch, workspace):
+        monkeypatch.setattr(fs_loop, "get_llm_client", fs_loop.DummyPlanner)
+        monkeypatch.setattr(
+            fs_loop, "call_fs_planner_llm", lambda *args: pytest.fail("planner called")
+        )
+
+        result = FsAgentLoop(root=str(workspace)).run("anything")
+
+        assert result["ok"] is True
+        assert result["steps"] == 1
+        assert result["history"][0]["plan"]["meta"]["planner"] == "disabled"
+        assert result["final_state"] == {"note": "Planner returned no tasks"}
+
+    def test_max_steps_reached(self, monkeypatch, workspace):
+        listing = {"tasks": [{"op": "list", "path": "."}]}
+        _scripted_planner(monkeypatch, [listing] * 3)
+
+        result = FsAgentLoop(root=str(workspace), max_steps=3).run("loop forever")
+
+        assert result["ok"] is False
+        assert result["steps"] == 3
+        assert len(result["history"]) == 3
+        assert result["final_state"] == {"error": "Max steps reached"}
+
+    def test_plan_is_recorded_without_copying(self, monkeypatch, workspace):
+        plan = {"tasks": [], "meta": {"reason": "done"}}
+        _scripted_planner(monkeypatch, [plan])
+
+        result = FsAgentLoop(root=str(workspace)).run("nothing to do")
+
+        assert result["history"][0]["plan"] is plan
+
+    def test_result_is_json_serializable(self, monkeypatch, workspace):
+        _scripted_planner(
+            monkeypatch, [{"tasks": [{"op": "read", "path": "notes.txt"}]}, {"tasks": []}]
+        )
+
+        result = FsAgentLoop(root=str(workspace)).run("read the notes")
+
+        assert json.loads(json.dumps(result)) == result
+
+    def test_each_observation_is_serialized_once(self, monkeypatch, workspace):
+        _scripted_planner(
+            monkeypatch, [{"tasks": [{"op": "list", "path": "."}]}, {"tasks": []}]
+        )
+        dumped = []
+        monkeypatch.setattr(
+            fs_loop, "_dumps_compact", lambda obj: dumped.append(obj) or "{}"
+        )
+
+        result = FsAgentLoop(root=str(workspace)).run("list the workspace")
+
+        assert dumped == [{}, result["history"][0]["execution"]]
+
+
+class TestBuildPlannerPrompt:
+    """Test the planner prompt layout."""
+
+    def test_preserialized_observation_is_used_verbatim(self):
+        prompt = fs_loop.build_planner_prompt("tidy up", {"ignored": True}, '{"ok":false}')
+
+        assert prompt.endswith('OBSERVATION:\n{"ok":false}\n')
+
+    def test_goal_and_compact_observation_follow_header(self):
+        prompt = fs_loop.build_planner_prompt("tidy up", {"ok": True, "tasks": [1, 2]})
+
+        assert prompt.startswith(fs_loop._PROMPT_HEADER)
+        assert prompt.endswith('tidy up\n\nOBSERVATION:\n{"ok":true,"tasks":[1,2]}\n')
+
+
+class TestCallFsPlannerLlm:
+    """Test cleanup of the planner LLM response."""
+
+    def test_missing_api_key_uses_cached_dummy_planner(self, monkeypatch):
+        monkeypatch.delenv("MISTRAL_API_KEY", raising=False)
+        fs_loop.get_llm_client.cache_clear()
+        try:
+            client = fs_loop.get_llm_client()
+
+            assert isinstance(client, fs_loop.DummyPlanner)
+            assert fs_loop.get_llm_client() is client
+            assert fs_loop.call_fs_planner_llm("goal", {})["meta"]["planner"] == "disabled"
+        finally:
+            fs_loop.get_llm_client.cache_clear()
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            '{"tasks": [], "meta": {"reason": "ok"}}',
+            '```json\n{"tasks": [], "meta": {"reason": "ok"}}\n```',
+            '```\n{"tasks": [], "meta": {"reason": "ok"}}\n```\n',
+            '`{"tasks": [], "meta": {"reason": "ok"}}`',
+            'Here is the plan:\n```json\n{"tasks": [], "meta": {"reason": "ok"}}\n```',
+        ],
+    )
+    def test_fences_are_stripped(self, monkeypatch, content):
+        _fake_llm(monkeypatch, content)
+
+        assert fs_loop.call_fs_planner_llm("goal", {}) == {
+            "tasks": [],
+            "meta": {"reason": "ok"},
+        }
+
+    def test_backticks_inside_values_are_kept(self, monkeypatch):
+        _fake_llm(monkeypatch, '```json\n{"tasks": [], "meta": {"reason": "use `ls`"}}\n```')
+
+        plan = fs_loop.call_fs_planner_llm("goal", {})
+
+        assert plan["meta"]["reason"] == "use `ls`"
+
+    def test_invalid_json_returns_empty_plan(self, monkeypatch):
+        _fake_llm(monkeypatch, "```json\nnot json\n```")
+
+        plan = fs_loop.call_fs_planner_llm("goal", {})
+
+        assert plan["tasks"] == []
+        assert plan["meta"]["reason"] == "Invalid JSON after cleanup"
+        assert plan["meta"]["cleaned"] == "not json"
+
+
+class TestFsRelay:
+    """Test the local plan relay."""
+
+    def test_agent_is_reused_across_calls(self):
+        from zenrube.agent_runtime import fs_relay
+
+        first = fs_relay._get_agent("/workspaces/ZenRube", allow_delete=True, allow_move=True)
+        second = fs_relay._get_agent("/workspaces/ZenRube", allow_delete=True, allow_move=True)
+        other = fs_relay._get_agent("/workspaces/ZenRube", allow_delete=False, allow_move=True)
+
+        assert first is second
+        assert other[1] is not first[1]
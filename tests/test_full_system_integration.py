@@ -9,31 +9,97 @@ Author: QA Engineering Team
 """
 
 import pytest
-import subprocess
-import sys
-import os
 import json
-import tempfile
-from unittest.mock import patch, mock_open, MagicMock
-from datetime import datetime
+import re
+from types import SimpleNamespace
+from unittest.mock import patch
 import logging
 
+import zenrube.cli
+
 # Set up logging for tests
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# A sentence is a run of text between periods that is not just whitespace
+_SENT_RE = re.compile(r'[^.]*[^.\s][^.]*')
+
+MESSY_INPUT = """  This is    messy    text... 
+    
+        with    lots   of     spaces    and    weird   formatting!!! 
+    
+        Also has    newlines    and    strange   characters.   """
+
+LONG_TEXT = """
+        The modern software development landscape has evolved significantly over the past decade.
+        Cloud computing, containerization, and microservices architecture have become standard practices.
+        DevOps methodologies have transformed how teams build, test, and deploy applications.
+        Continuous integration and continuous deployment (CI/CD) pipelines are now essential.
+        Automated testing, monitoring, and observability tools have improved software quality.
+        Artificial intelligence and machine learning are increasingly integrated into development workflows.
+        Security practices have become more sophisticated with shift-left security approaches.
+        """
+
+MOCK_MANIFEST = {
+    "experts": [
+        {
+            "name": "test_expert",
+            "version": "1.0.0",
+            "description": "Test expert for validation",
+            "author": "test@zenrube.com"
+        }
+    ],
+    "manifest_version": "1.0",
+    "publisher": "test@zenrube.com"
+}
+
+SUMMARIZER_SENTENCES = "Sentence one. Sentence two. Sentence three. Sentence four. Sentence five."
+
+EXPECTED_MODULES = {
+    'zenrube',
+    'zenrube.cli',
+    'zenrube.config',
+    'zenrube.experts',
+    'zenrube.experts.expert_registry',
+    'zenrube.experts.data_cleaner',
+    'zenrube.experts.semantic_router',
+    'zenrube.experts.summarizer',
+    'zenrube.experts.publisher',
+    'zenrube.experts.rube_adapter',
+    'zenrube.experts.version_manager',
+    'zenrube.experts.autopublisher',
+}
+
+# Class each module must export
+EXPECTED_CLASSES = {
+    'zenrube.experts.expert_registry': 'ExpertRegistry',
+    'zenrube.experts.data_cleaner': 'DataCleanerExpert',
+    'zenrube.experts.semantic_router': 'SemanticRouterExpert',
+    'zenrube.experts.summarizer': 'SummarizerExpert',
+    'zenrube.experts.publisher': 'PublisherExpert',
+    'zenrube.experts.rube_adapter': 'RubeAdapterExpert',
+    'zenrube.experts.version_manager': 'VersionManagerExpert',
+    'zenrube.experts.autopublisher': 'AutoPublisherExpert',
+}
+
+
+def _invoke(capsys, argv):
+    """Run the CLI in-process and return a subprocess-like result."""
+    try:
+        rc = zenrube.cli.main(argv)
+    except SystemExit as e:
+        rc = e.code or 0
+    out, err = capsys.readouterr()
+    return SimpleNamespace(returncode=rc, stdout=out, stderr=err)
+
 
 class TestFullSystemIntegration:
     """Complete system integration tests for Zenrube MCP."""
 
-    def test_cli_help_and_version(self):
+    @pytest.mark.xdist_group("cli")
+    def test_cli_help_and_version(self, capsys):
         """Test CLI help and version commands work correctly."""
-        result = subprocess.run(
-            [sys.executable, "-m", "zenrube.cli", "--help"],
-            capture_output=True,
-            text=True,
-            cwd=os.getcwd()
-        )
+        result = _invoke(capsys, ["--help"])
         
         assert result.returncode == 0
         assert "zenrube-cli" in result.stdout
@@ -43,26 +109,17 @@ class TestFullSystemIntegration:
         assert "changelog" in result.stdout
         assert "version" in result.stdout
 
-    def test_cli_version_command(self):
+    @pytest.mark.xdist_group("cli")
+    def test_cli_version_command(self, capsys):
         """Test CLI version command displays correct information."""
-        result = subprocess.run(
-            [sys.executable, "-m", "zenrube.cli", "version"],
-            capture_output=True,
-            text=True,
-            cwd=os.getcwd()
-        )
+        result = _invoke(capsys, ["version"])
         
         assert result.returncode == 0
         assert "Zenrube CLI v1.0" in result.stdout
         assert "Expert Versions:" in result.stdout
 
-    def test_expert_registry_discovery(self):
+    def test_expert_registry_discovery(self, discovered_experts):
         """Test that ExpertRegistry discovers all expected experts."""
-        from zenrube.experts.expert_registry import ExpertRegistry
-        
-        registry = ExpertRegistry()
-        discovered_experts = registry.discover_experts()
-        
         expected_experts = {
             'data_cleaner',
             'semantic_router', 
@@ -85,37 +142,23 @@ class TestFullSystemIntegration:
         
         logger.info(f"Successfully discovered {len(discovered_experts)} experts")
 
-    def test_data_cleaner_pipeline(self):
+    def test_data_cleaner_pipeline(self, data_cleaner):
         """Test DataCleaner expert with messy text input."""
-        from zenrube.experts.data_cleaner import DataCleanerExpert
-        
-        expert = DataCleanerExpert()
-        
-        messy_input = """  This is    messy    text... 
-    
-        with    lots   of     spaces    and    weird   formatting!!! 
-    
-        Also has    newlines    and    strange   characters.   """
-        
-        result = expert.run(messy_input)
+        result = data_cleaner.run(MESSY_INPUT)
         
         assert isinstance(result, str)
         assert len(result.strip()) > 0
         # Should have cleaned up formatting (first letter capitalized, newlines cleaned)
         assert result.strip().startswith("This is")
         # Should have proper formatting
-        assert len(result.split('\n')) <= len(messy_input.split('\n'))
+        assert len(result.split('\n')) <= len(MESSY_INPUT.split('\n'))
         
         logger.info("DataCleaner test passed with normalized text output")
 
-    def test_semantic_router_pipeline(self):
+    def test_semantic_router_pipeline(self, semantic_router):
         """Test SemanticRouter expert with invoice processing intent."""
-        from zenrube.experts.semantic_router import SemanticRouterExpert
-        
-        expert = SemanticRouterExpert()
-        
         input_text = "Please process this invoice."
-        result = expert.run(input_text)
+        result = semantic_router.run(input_text)
         
         assert isinstance(result, dict)
         assert 'intent' in result
@@ -127,43 +170,24 @@ class TestFullSystemIntegration:
         
         logger.info(f"SemanticRouter detected intent: {result['intent']}, route: {result['route']}")
 
-    def test_summarizer_pipeline(self):
+    def test_summarizer_pipeline(self, summarizer):
         """Test Summarizer expert with long text input."""
-        from zenrube.experts.summarizer import SummarizerExpert
-        
-        expert = SummarizerExpert()
-        
-        long_text = """
-        The modern software development landscape has evolved significantly over the past decade.
-        Cloud computing, containerization, and microservices architecture have become standard practices.
-        DevOps methodologies have transformed how teams build, test, and deploy applications.
-        Continuous integration and continuous deployment (CI/CD) pipelines are now essential.
-        Automated testing, monitoring, and observability tools have improved software quality.
-        Artificial intelligence and machine learning are increasingly integrated into development workflows.
-        Security practices have become more sophisticated with shift-left security approaches.
-        """
-        
-        result = expert.run(long_text)
+        result = summarizer.run(LONG_TEXT)
         
         assert isinstance(result, str)
         # Count sentences in result
-        sentences = result.split('.')
-        sentence_count = len([s for s in sentences if s.strip()])
+        sentence_count = len(_SENT_RE.findall(result))
         # Should be 3 sentences or fewer
         assert sentence_count <= 3
         # Should be shorter than input
-        assert len(result) < len(long_text)
+        assert len(result) < len(LONG_TEXT)
         
         logger.info(f"Summarizer reduced text to {sentence_count} sentences")
 
-    def test_manifest_generation_and_validation(self):
+    def test_manifest_generation_and_validation(self, publisher):
         """Test Publisher expert generates and validates manifest."""
-        from zenrube.experts.publisher import PublisherExpert
-        
-        expert = PublisherExpert()
-        
         # Test manifest generation
-        manifest = expert.generate_manifest()
+        manifest = publisher.generate_manifest()
         
         assert isinstance(manifest, dict)
         assert 'experts' in manifest
@@ -182,116 +206,83 @@ class TestFullSystemIntegration:
                 assert field in expert_info, f"Missing field '{field}' in expert metadata"
         
         # Test validation (returns bool, not dict)
-        validation_result = expert.validate_manifest(manifest)
+        validation_result = publisher.validate_manifest(manifest)
         assert validation_result is True
         
         logger.info("Manifest generation and validation successful")
 
-    def test_rube_adapter_auth_and_publish_mock(self):
+    def test_rube_adapter_auth_and_publish_mock(self, monkeypatch, rube_adapter):
         """Test RubeAdapter expert with mocked authentication and publishing."""
-        from zenrube.experts.rube_adapter import RubeAdapterExpert
-        
-        expert = RubeAdapterExpert()
-        
-        # Mock manifest data
-        mock_manifest = {
-            "experts": [
-                {
-                    "name": "test_expert",
-                    "version": "1.0.0",
-                    "description": "Test expert for validation",
-                    "author": "test@zenrube.com"
-                }
-            ],
-            "manifest_version": "1.0",
-            "publisher": "test@zenrube.com"
-        }
-        
         # Mock the authentication and publish methods
-        with patch.object(expert, 'authenticate') as mock_auth, \
-             patch.object(expert, 'publish_manifest') as mock_publish:
-            
-            mock_auth.return_value = {"status": "success", "token": "mock_token"}
-            mock_publish.return_value = {
-                "status": "success", 
-                "manifest_id": "test_123",
-                "published_experts": 1
-            }
-            
-            # Test authentication
-            auth_result = expert.authenticate()
-            assert auth_result['status'] == 'success'
-            
-            # Test publishing
-            publish_result = expert.publish_manifest(mock_manifest)
-            assert publish_result['status'] == 'success'
-            assert 'manifest_id' in publish_result
+        monkeypatch.setattr(rube_adapter, 'authenticate',
+                            lambda: {"status": "success", "token": "mock_token"})
+        monkeypatch.setattr(rube_adapter, 'publish_manifest', lambda manifest: {
+            "status": "success", 
+            "manifest_id": "test_123",
+            "published_experts": 1
+        })
+        
+        # Test authentication
+        auth_result = rube_adapter.authenticate()
+        assert auth_result['status'] == 'success'
+        
+        # Test publishing
+        publish_result = rube_adapter.publish_manifest(MOCK_MANIFEST)
+        assert publish_result['status'] == 'success'
+        assert 'manifest_id' in publish_result
             
         logger.info("RubeAdapter auth and publish mock test successful")
 
-    def test_version_manager_and_changelog(self):
+    @pytest.mark.xdist_group("zenrube_integration")
+    def test_version_manager_and_changelog(self, monkeypatch, tmp_path, version_manager):
         """Test VersionManager expert with version bumping and changelog."""
-        from zenrube.experts.version_manager import VersionManagerExpert
-        
-        expert = VersionManagerExpert()
+        # Point the changelog at a real, empty temporary file
+        changelog_path = tmp_path / "changelog.json"
+        changelog_path.write_text("[]")
+        monkeypatch.setattr(version_manager, "changelog_file", str(changelog_path))
+        
+        # Test version bump - actual method signature is different
+        new_version = version_manager.bump_version("test_expert", 'patch')
+        
+        assert new_version == "1.0.1"  # Patch bump from default 1.0.0
+        
+        # Test changelog recording - use correct method name
+        version_manager.record_changelog(
+            expert_name="test_expert",
+            change_summary="Test version bump for integration testing",
+            old_version="1.0.0",
+            new_version="1.0.1"
+        )
         
-        # Create a temporary changelog file for testing
-        test_changelog_data = []
+        entries = json.loads(changelog_path.read_text())
+        assert len(entries) == 1
+        assert entries[0]["expert_name"] == "test_expert"
+        assert entries[0]["new_version"] == "1.0.1"
         
-        with patch('builtins.open', mock_open()) as mock_file, \
-             patch('json.load', return_value=test_changelog_data), \
-             patch('os.path.exists', return_value=True):
-            
-            # Test version bump - actual method signature is different
-            new_version = expert.bump_version("test_expert", 'patch')
-            
-            assert new_version == "1.0.1"  # Patch bump from default 1.0.0
-            
-            # Test changelog recording - use correct method name
-            with patch('builtins.open', mock_open()) as mock_file_write:
-                expert.record_changelog(
-                    expert_name="test_expert",
-                    change_summary="Test version bump for integration testing",
-                    old_version="1.0.0",
-                    new_version="1.0.1"
-                )
-            
         logger.info("VersionManager and changelog test successful")
 
-    def test_autopublisher_workflow(self):
+    def test_autopublisher_workflow(self, monkeypatch, autopublisher):
         """Test AutoPublisher expert end-to-end workflow with mocks."""
-        from zenrube.experts.autopublisher import AutoPublisherExpert
+        # Mock the actual methods that exist in AutoPublisherExpert
+        monkeypatch.setattr(autopublisher, 'run_autopublish', lambda: {
+            "status": "success", 
+            "message": "Auto-publish completed successfully"
+        })
         
-        expert = AutoPublisherExpert()
+        # Test autopublish workflow
+        result = autopublisher.run_autopublish()
+        
+        assert 'status' in result
+        assert isinstance(result, dict)
+        assert result['status'] == 'success'
         
-        # Mock the actual methods that exist in AutoPublisherExpert
-        with patch.object(expert, 'run_autopublish') as mock_run_autopublish:
-            mock_run_autopublish.return_value = {
-                "status": "success", 
-                "message": "Auto-publish completed successfully"
-            }
-            
-            # Test autopublish workflow
-            result = expert.run_autopublish()
-            
-            assert 'status' in result
-            assert isinstance(result, dict)
-            assert result['status'] == 'success'
-            
         logger.info("AutoPublisher workflow test successful")
 
-    def test_cli_end_to_end(self):
+    @pytest.mark.xdist_group("cli")
+    def test_cli_end_to_end(self, capsys):
         """Test CLI commands end-to-end with proper error handling."""
-        import subprocess
-        import sys
-        
         # Test zenrube list command
-        result = subprocess.run(
-            [sys.executable, "-m", "zenrube.cli", "list"],
-            capture_output=True,
-            text=True,
-            cwd=os.getcwd()
-        )
+        result = _invoke(capsys, ["list"])
         
         # Command should run without crashing
         assert result.returncode == 0
@@ -302,12 +293,7 @@ class TestFullSystemIntegration:
         assert "semantic_router" in result.stdout
         
         # Test zenrube version command
-        result = subprocess.run(
-            [sys.executable, "-m", "zenrube.cli", "version"],
-            capture_output=True,
-            text=True,
-            cwd=os.getcwd()
-        )
+        result = _invoke(capsys, ["version"])
         
         assert result.returncode == 0
         assert "Zenrube CLI v1.0" in result.stdout
@@ -315,50 +301,39 @@ class TestFullSystemIntegration:
         
         logger.info("CLI end-to-end test successful - all commands working")
 
-    def test_full_integration_with_mocks(self):
+    @pytest.mark.xdist_group("zenrube_integration")
+    def test_full_integration_with_mocks(
+        self, monkeypatch, discovered_experts, data_cleaner, semantic_router,
+        summarizer, publisher, version_manager, rube_adapter
+    ):
         """Test full system integration using mocked external dependencies."""
-        from zenrube.experts.expert_registry import ExpertRegistry
-        from zenrube.experts.data_cleaner import DataCleanerExpert
-        from zenrube.experts.semantic_router import SemanticRouterExpert
-        from zenrube.experts.summarizer import SummarizerExpert
-        from zenrube.experts.publisher import PublisherExpert
-        from zenrube.experts.rube_adapter import RubeAdapterExpert
-        from zenrube.experts.version_manager import VersionManagerExpert
-        
         # Test 1: Registry discovery
-        registry = ExpertRegistry()
-        experts = registry.discover_experts()
-        assert len(experts) >= 7  # At least 7 experts should be discovered
+        assert len(discovered_experts) >= 7  # At least 7 experts should be discovered
         
         # Test 2: Data processing pipeline
-        cleaner = DataCleanerExpert()
         messy_data = "  Test   data   with   spaces  "
-        clean_data = cleaner.run(messy_data)
+        clean_data = data_cleaner.run(messy_data)
         assert isinstance(clean_data, str)  # Should return string
         assert clean_data.strip()  # Should not be empty
         
         # Test 3: Intent routing
-        router = SemanticRouterExpert()
-        intent_result = router.run("Analyze this document")
+        intent_result = semantic_router.run("Analyze this document")
         assert 'intent' in intent_result
         assert 'route' in intent_result
         
         # Test 4: Text summarization
-        summarizer = SummarizerExpert()
         long_text = "First sentence. Second sentence. Third sentence. Fourth sentence. Fifth sentence."
         summary = summarizer.run(long_text)
-        summary_sentences = len([s for s in summary.split('.') if s.strip()])
+        summary_sentences = len(_SENT_RE.findall(summary))
         assert summary_sentences <= 3
         
         # Test 5: Manifest generation
-        publisher = PublisherExpert()
         manifest = publisher.generate_manifest()
         assert 'experts' in manifest
         assert 'manifest_version' in manifest  # Correct key
         assert 'publisher' in manifest
         
         # Test 6: Version management
-        version_manager = VersionManagerExpert()
         new_version = version_manager.bump_version("test_expert_integration", "patch")
         # Version manager uses in-memory state, so we just check it follows semantic versioning
         version_parts = new_version.split('.')
@@ -368,21 +343,16 @@ class TestFullSystemIntegration:
         assert new_version in ["1.0.1", "1.0.2", "1.0.3", "1.0.4", "1.0.5"]
         
         # Test 7: Rube adapter with mock
-        rube_adapter = RubeAdapterExpert()
-        with patch.object(rube_adapter, 'authenticate') as mock_auth:
-            mock_auth.return_value = {"status": "success"}
-            auth_result = rube_adapter.authenticate()
-            assert auth_result['status'] == 'success'
+        monkeypatch.setattr(rube_adapter, 'authenticate', lambda: {"status": "success"})
+        auth_result = rube_adapter.authenticate()
+        assert auth_result['status'] == 'success'
         
         logger.info("Full integration test completed successfully")
 
-    def test_error_handling_and_resilience(self):
+    def test_error_handling_and_resilience(self, zenrube_modules, data_cleaner):
         """Test system resilience and error handling."""
-        from zenrube.experts.expert_registry import ExpertRegistry
-        from zenrube.experts.data_cleaner import DataCleanerExpert
-        
-        # Test registry with empty directory
-        registry = ExpertRegistry()
+        # Test a fresh registry (not the shared one) with an empty directory
+        registry = zenrube_modules['zenrube.experts.expert_registry'].ExpertRegistry()
         
         with patch('os.listdir', return_value=[]):
             experts = registry.discover_experts()
@@ -390,146 +360,77 @@ class TestFullSystemIntegration:
             assert len(experts) == 0
         
         # Test data cleaner with empty input
-        cleaner = DataCleanerExpert()
-        empty_result = cleaner.run("")
+        empty_result = data_cleaner.run("")
         assert isinstance(empty_result, str)
         
         # Test data cleaner with None input (should handle gracefully)
-        none_result = cleaner.run(None)
+        none_result = data_cleaner.run(None)
         assert isinstance(none_result, (str, type(None)))  # Could return None or string
         
         logger.info("Error handling and resilience test passed")
 
-    def test_package_structure_and_imports(self):
+    def test_package_structure_and_imports(self, zenrube_modules):
         """Test that all package components can be imported correctly."""
-        # Test core imports
-        try:
-            import zenrube
-            import zenrube.cli
-            import zenrube.config
-            import zenrube.experts
-            import zenrube.experts.expert_registry
-            import zenrube.experts.data_cleaner
-            import zenrube.experts.semantic_router
-            import zenrube.experts.summarizer
-            import zenrube.experts.publisher
-            import zenrube.experts.rube_adapter
-            import zenrube.experts.version_manager
-            import zenrube.experts.autopublisher
-        except ImportError as e:
-            pytest.fail(f"Failed to import Zenrube module: {e}")
+        assert set(zenrube_modules) == EXPECTED_MODULES
         
         # Test that CLI module has main function
-        assert hasattr(zenrube.cli, 'main')
+        assert hasattr(zenrube_modules['zenrube.cli'], 'main')
         
         # Test that all experts have required classes
-        assert hasattr(zenrube.experts.expert_registry, 'ExpertRegistry')
-        assert hasattr(zenrube.experts.data_cleaner, 'DataCleanerExpert')
-        assert hasattr(zenrube.experts.semantic_router, 'SemanticRouterExpert')
-        assert hasattr(zenrube.experts.summarizer, 'SummarizerExpert')
-        assert hasattr(zenrube.experts.publisher, 'PublisherExpert')
-        assert hasattr(zenrube.experts.rube_adapter, 'RubeAdapterExpert')
-        assert hasattr(zenrube.experts.version_manager, 'VersionManagerExpert')
-        assert hasattr(zenrube.experts.autopublisher, 'AutoPublisherExpert')
+        for module_name, class_name in EXPECTED_CLASSES.items():
+            assert hasattr(zenrube_modules[module_name], class_name), (
+                f"{module_name} is missing {class_name}"
+            )
         
         logger.info("All package structure and imports test passed")
 
-    def test_cli_integration_with_experts(self):
+    @pytest.mark.xdist_group("cli")
+    def test_cli_integration_with_experts(self, capsys):
         """Test CLI integration with actual expert loading and execution."""
-        import tempfile
-        import os
-        
-        # Test that CLI can load and execute experts
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create a test input file
-            test_input = "Test data for processing"
-            input_file = os.path.join(temp_dir, "test_input.txt")
-            with open(input_file, 'w') as f:
-                f.write(test_input)
-            
-            # Test running an expert via CLI
-            result = subprocess.run(
-                [sys.executable, "-m", "zenrube.cli", "run", 
-                 "--expert", "data_cleaner", "--input", test_input],
-                capture_output=True,
-                text=True,
-                cwd=os.getcwd()
-            )
-            
-            # Should not crash - allow any return code
-            assert result.returncode in [0, 1]  # 0=success, 1=validation error (acceptable)
-            
-            # Test autopublish command (should not crash)
-            result = subprocess.run(
-                [sys.executable, "-m", "zenrube.cli", "autopublish"],
-                capture_output=True,
-                text=True,
-                cwd=os.getcwd()
-            )
-            
-            # Should run without crashing
-            assert result.returncode in [0, 1]  # 0=success, 1=validation failure (acceptable)
-        
-        logger.info("CLI integration with experts test completed")
-
-    def test_individual_expert_functionality(self):
-        """Test each expert's core functionality individually."""
-        from zenrube.experts.data_cleaner import DataCleanerExpert
-        from zenrube.experts.semantic_router import SemanticRouterExpert
-        from zenrube.experts.summarizer import SummarizerExpert
-        from zenrube.experts.publisher import PublisherExpert
-        from zenrube.experts.version_manager import VersionManagerExpert
-        from zenrube.experts.rube_adapter import RubeAdapterExpert
-        from zenrube.experts.autopublisher import AutoPublisherExpert
-        
-        # Test DataCleaner
-        cleaner = DataCleanerExpert()
-        result = cleaner.run("  messy   text  ")
-        assert isinstance(result, str)
-        
-        # Test SemanticRouter  
-        router = SemanticRouterExpert()
-        result = router.run("error occurred")
-        assert result['intent'] == 'error'
-        assert result['route'] == 'debug_expert'
-        
-        # Test Summarizer
-        summarizer = SummarizerExpert()
-        long_text = "Sentence one. Sentence two. Sentence three. Sentence four. Sentence five."
-        result = summarizer.run(long_text)
-        assert isinstance(result, str)
-        assert len(result) < len(long_text)
+        # Only exit codes are checked; _invoke still drains capsys between calls
+        test_input = "Test data for processing"
         
-        # Test Publisher
-        publisher = PublisherExpert()
-        manifest = publisher.generate_manifest()
-        assert isinstance(manifest, dict)
-        assert 'experts' in manifest
+        # Test running an expert via CLI
+        result = _invoke(capsys, ["run", "--expert", "data_cleaner", "--input", test_input])
         
-        # Test VersionManager
-        version_manager = VersionManagerExpert()
-        version = version_manager.bump_version("test", "patch")
-        assert version == "1.0.1"
+        # Should not crash - allow any return code
+        assert result.returncode in [0, 1]  # 0=success, 1=validation error (acceptable)
         
-        # Test RubeAdapter (basic instantiation)
-        rube_adapter = RubeAdapterExpert()
-        assert hasattr(rube_adapter, 'authenticate')
-        assert hasattr(rube_adapter, 'publish_manifest')
+        # Test autopublish command (should not crash)
+        result = _invoke(capsys, ["autopublish"])
         
-        # Test AutoPublisher (basic instantiation)
-        autopublisher = AutoPublisherExpert()
-        assert hasattr(autopublisher, 'run_autopublish')
+        # Should run without crashing
+        assert result.returncode in [0, 1]  # 0=success, 1=validation failure (acceptable)
         
-        logger.info("Individual expert functionality tests passed")
+        logger.info("CLI integration with experts test completed")
+
+    @pytest.mark.xdist_group("zenrube_integration")
+    @pytest.mark.parametrize("expert_fixture,call,check", [
+        ("data_cleaner", lambda e: e.run("  messy   text  "),
+         lambda r: isinstance(r, str)),
+        ("semantic_router", lambda e: e.run("error occurred"),
+         lambda r: r['intent'] == 'error' and r['route'] == 'debug_expert'),
+        ("summarizer", lambda e: e.run(SUMMARIZER_SENTENCES),
+         lambda r: isinstance(r, str) and len(r) < len(SUMMARIZER_SENTENCES)),
+        ("publisher", lambda e: e.generate_manifest(),
+         lambda r: isinstance(r, dict) and 'experts' in r),
+        ("version_manager", lambda e: e.bump_version("test", "patch"),
+         lambda r: r == "1.0.1"),
+        # Basic instantiation: the publishing entry points exist
+        ("rube_adapter", lambda e: e,
+         lambda r: hasattr(r, 'authenticate') and hasattr(r, 'publish_manifest')),
+        ("autopublisher", lambda e: e,
+         lambda r: hasattr(r, 'run_autopublish')),
+    ])
+    def test_individual_expert_functionality(self, request, expert_fixture, call, check):
+        """Test each expert's core functionality individually."""
+        expert = request.getfixturevalue(expert_fixture)
+        result = call(expert)
+        assert check(result), f"{expert_fixture} returned unexpected result: {result!r}"
 
-    def test_expert_metadata_consistency(self):
+    def test_expert_metadata_consistency(self, registry, discovered_experts):
         """Test that all experts have consistent metadata structure."""
-        from zenrube.experts.expert_registry import ExpertRegistry
-        
-        registry = ExpertRegistry()
-        experts = registry.discover_experts()
-        
-        for expert_name in experts:
+        for expert_name in discovered_experts:
             expert_info = registry.get_expert_info(expert_name)
             if expert_info:
                 # Check required metadata fields
@@ -544,4 +445,5 @@ class TestFullSystemIntegration:
 
 if __name__ == "__main__":
     # Run tests if module is executed directly
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    # Mirror the project addopts so a direct run also skips .pytest_cache I/O
+    pytest.main([__file__, "-v", "-p", "no:cacheprovider"])
\ No newline at end of file
@@ -16,6 +16,7 @@ from zenrube.profiles.personality_presets import (
 )
 from zenrube.profiles.personality_engine import (
     assign_personalities,
+    assign_personalities_with_prefixes,
     build_personality_prefix,
     select_personality_mode,
     PersonalityEngine
@@ -75,6 +76,13 @@ class TestPersonalityPresets(unittest.TestCase):
                 self.assertIn(field, neutral_mode,
                             f"Expert {expert_name} neutral_mode missing field: {field}")
     
+    def test_preset_table_is_read_only(self):
+        """Test that PERSONALITY_PRESETS cannot be modified at runtime"""
+        with self.assertRaises(TypeError):
+            PERSONALITY_PRESETS["new_expert"] = {}
+        with self.assertRaises(TypeError):
+            PERSONALITY_PRESETS["security_analyst"]["neutral_mode"] = {}
+    
     def test_get_personality_returns_correct_dict(self):
         """Test get_personality function returns correct personality dict"""
         # Test existing expert and mode
@@ -90,6 +98,14 @@ class TestPersonalityPresets(unittest.TestCase):
         # Test non-existent mode
         result = get_personality("security_analyst", "non_existent_mode")
         self.assertEqual(result, {})
+
+    def test_missing_personality_results_are_not_shared(self):
+        """Test that filling in one miss does not leak into later misses"""
+        get_personality("non_existent_expert", "any_mode")["tone"] = "changed"
+        get_neutral_personality("non_existent_expert")["tone"] = "changed"
+
+        self.assertEqual(get_personality("non_existent_expert", "any_mode"), {})
+        self.assertEqual(get_neutral_personality("non_existent_expert"), {})
     
     def test_get_neutral_personality_returns_neutral_mode(self):
         """Test get_neutral_personality returns neutral_mode for each expert"""
@@ -293,6 +309,14 @@ class TestPersonalitySafety(unittest.TestCase):
         self.assertTrue(summary["neutral_fallback_used"])
         self.assertIn("2+ overrides", summary["reason"])
     
+    def test_safety_summary_lists_distinct_tones(self):
+        """Test that the safety summary reports the distinct resulting tones"""
+        _, summary = apply_safety_governor("technical", 2, "coding", self.mock_personalities)
+        self.assertEqual(summary["tones"], ["direct", "dry, precise"])
+        
+        _, summary = apply_safety_governor("emotional", 1, "sensitive", self.mock_personalities)
+        self.assertEqual(summary["tones"], ["neutral"])
+    
     def test_safety_governor_class_roast_level_zero(self):
         """Test SafetyGovernor class handles roast_level=0"""
         governor = SafetyGovernor()
@@ -342,6 +366,23 @@ class TestPersonalitySystemIntegration(unittest.TestCase):
         # No exceptions should be raised, all should work correctly
         self.assertTrue(True)
     
+    def test_assign_personalities_with_prefixes_matches_separate_steps(self):
+        """Test the fused helper agrees with assign -> safety -> prefix run separately"""
+        mock_profile = {
+            "experts": ["security_analyst", "pattern_brain"],
+            "task_type": "coding"
+        }
+        
+        assignments, summary = assign_personalities_with_prefixes(mock_profile, "technical", 1)
+        
+        personalities = assign_personalities(mock_profile, "technical", 1)
+        safe_personalities, expected_summary = apply_safety_governor("technical", 1, "coding", personalities)
+        self.assertEqual(summary, expected_summary)
+        self.assertEqual(list(assignments), list(safe_personalities))
+        for expert_name, (personality, prefix) in assignments.items():
+            self.assertEqual(personality, safe_personalities[expert_name])
+            self.assertEqual(prefix, build_personality_prefix(expert_name, personality, "coding"))
+    
     def test_all_experts_integration(self):
         """Test integration with all available experts"""
         all_experts = [
@@ -1,5 +1,6 @@
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
 
 import pytest
 
@@ -21,20 +22,27 @@ class EchoProvider(providers.LLMProvider):
         return prompt, {"model": model}
 
 
+@pytest.fixture
+def restore_cache_manager() -> Iterator[None]:
+    """Reset the process-wide CacheManager even when the test fails."""
+    yield
+    cache.CacheManager.configure(cache.InMemoryCache())
+
+
 def test_cache_manager_memory(monkeypatch: pytest.MonkeyPatch) -> None:
     cache.CacheManager.configure(cache.InMemoryCache(), ttl=1)
     key = cache.build_cache_key("demo", "memory")
     cache.CacheManager.set(key, {"value": 1})
     assert cache.CacheManager.get(key) == {"value": 1}
 
-    original_time = cache.time.time
+    original_time = cache.time.monotonic_ns
 
-    def fake_time() -> float:
-        return original_time() + 10
+    def fake_time() -> int:
+        return original_time() + 10_000_000_000
 
-    monkeypatch.setattr(cache.time, "time", fake_time)
+    monkeypatch.setattr(cache.time, "monotonic_ns", fake_time)
     assert cache.CacheManager.get(key) is None
-    monkeypatch.setattr(cache.time, "time", original_time)
+    monkeypatch.setattr(cache.time, "monotonic_ns", original_time)
 
 
 def test_cache_manager_file(tmp_path: Path) -> None:
@@ -44,7 +52,7 @@ def test_cache_manager_file(tmp_path: Path) -> None:
     assert cache.CacheManager.get(key) == {"value": 42}
 
 
-def test_load_config_registers_custom_expert(
+def test_apply_config_registers_custom_expert(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     yaml_content = """
@@ -61,6 +69,7 @@ logging:
 
     data = config.load_config(config_path)
     assert data["logging"]["level"].upper() == "DEBUG"
+    config.apply_config(data)
     expert = get_expert("test_custom")
     assert "test data" in expert.system_prompt
 
@@ -75,6 +84,11 @@ def test_build_synthesis_config_overrides() -> None:
     }
     synthesis_config = config.build_synthesis_config(overrides)
     assert synthesis_config.synthesis_style == "critical"
+    explicit = config.build_synthesis_config(
+        overrides, base_config={"cache": {"ttl": 7}}
+    )
+    assert explicit.cache_ttl_seconds == 7
+    assert explicit.synthesis_style == "critical"
     assert synthesis_config.parallel_execution is False
     assert synthesis_config.provider == "echo"
     assert synthesis_config.logging_level == "WARNING"
@@ -102,3 +116,228 @@ def test_provider_registry_and_configure_rube_client() -> None:
     response, meta = zenrube.invoke_llm("hello", provider="rube")
     assert response == "dummy:hello"
     assert meta["model"] is None
+
+
+def test_in_memory_cache_concurrent_reads_and_writes() -> None:
+    backend = cache.InMemoryCache()
+    errors = []
+
+    def worker(worker_id: int) -> None:
+        try:
+            for i in range(200):
+                key = f"k{i % 10}"
+                backend.set(key, (worker_id, i), ttl=60)
+                value = backend.get(key)
+                assert value is not None and len(value) == 2
+        except Exception as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+def test_in_memory_cache_sweeps_expired_entries(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    backend = cache.InMemoryCache()
+    backend.set("short", 1, ttl=1)
+    backend.set("long", 2, ttl=100)
+    backend.set("forever", 3)
+
+    original_time = cache.time.monotonic_ns
+    monkeypatch.setattr(
+        cache.time, "monotonic_ns", lambda: original_time() + 50_000_000_000
+    )
+    assert backend.get("short") is None
+    assert backend.get_many(["short", "long", "forever"]) == {"long": 2, "forever": 3}
+    assert "short" in backend._store
+
+    backend.set("fresh", 4)
+    assert set(backend._store) == {"long", "forever", "fresh"}
+
+
+def test_file_cache_filenames_are_safe_and_distinct(tmp_path: Path) -> None:
+    backend = cache.FileCache(tmp_path)
+    first = backend._path("demo::a/b")
+    second = backend._path("demo::a_b")
+
+    assert first.parent == tmp_path
+    assert first.name.startswith("demo__a_b_")
+    assert first != second
+    assert backend._path("demo::a/b") == first
+
+
+def test_file_cache_writes_in_background_and_flushes(tmp_path: Path) -> None:
+    backend = cache.FileCache(tmp_path)
+    backend.set("demo::bg", {"value": 1}, ttl=60)
+    backend.set("demo::bg", {"value": 2}, ttl=60)
+    assert backend.get("demo::bg") == {"value": 2}
+
+    backend.flush()
+    assert not list(tmp_path.glob("*.tmp"))
+    assert cache.FileCache(tmp_path).get("demo::bg") == {"value": 2}
+
+
+def test_file_cache_misses_skip_the_filesystem(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    backend = cache.FileCache(tmp_path)
+    backend.set("demo::hit", {"value": 1})
+    backend.flush()
+
+    def _no_disk(self: Path, *args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("cache directory was touched")
+
+    for method in ("exists", "stat", "read_bytes"):
+        monkeypatch.setattr(Path, method, _no_disk)
+    assert backend.get("demo::miss") is None
+    monkeypatch.undo()
+
+    assert cache.FileCache(tmp_path).get("demo::hit") == {"value": 1}
+
+
+def test_redis_payloads_mark_their_format(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Untagged payloads are JSON, whichever encoder this process has
+    assert cache._decode_redis(b"5") == 5
+    assert cache._decode_redis(b'{"a": [1]}') == {"a": [1]}
+    assert cache._decode_redis(b"plain text") == b"plain text"
+    assert cache._decode_redis(cache._encode_redis({"a": 1})) == {"a": 1}
+
+    monkeypatch.setattr(cache, "msgspec", None)
+    assert cache._encode_redis(5) == b"5"
+    assert cache._decode_redis(cache._REDIS_MSGPACK_TAG + b"\x35") is None
+
+
+class CountingCache(cache.InMemoryCache):
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads = 0
+
+    def get(self, key: str) -> Any:
+        self.reads += 1
+        return super().get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        keys = list(keys)
+        self.reads += len(keys)
+        return super().get_many(keys)
+
+    def get_with_ttl(self, key: str) -> Tuple[Any, Optional[float]]:
+        self.reads += 1
+        return super().get_with_ttl(key)
+
+
+def test_tiered_cache_serves_repeat_reads_from_memory() -> None:
+    inner = CountingCache()
+    inner.set("warm", "from-backend")
+    tiered = cache.TieredCache(inner, capacity=2)
+
+    assert tiered.get("warm") == "from-backend"
+    assert tiered.get("warm") == "from-backend"
+    assert inner.reads == 1
+
+    tiered.set("a", 1)
+    tiered.set("b", 2)
+    assert "warm" not in tiered._front
+    assert tiered.get("warm") == "from-backend"
+    assert inner.reads == 2
+
+
+def test_tiered_cache_expires_backend_reads_with_the_entry(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    inner = cache.FileCache(tmp_path)
+    inner.set("short", "v", ttl=1)
+    inner.set("forever", "w")
+    tiered = cache.TieredCache(inner)
+    assert tiered.get("short") == "v"
+    assert tiered.get_many(["forever"]) == {"forever": "w"}
+
+    wall, mono = cache.time.time, cache.time.monotonic_ns
+    monkeypatch.setattr(cache.time, "time", lambda: wall() + 2)
+    monkeypatch.setattr(cache.time, "monotonic_ns", lambda: mono() + 2 * 1_000_000_000)
+
+    assert tiered.get("short") is None
+    assert tiered.get_many(["short", "forever"]) == {"forever": "w"}
+    inner.flush()
+
+
+def test_cache_manager_from_config_tiers_file_backend(
+    tmp_path: Path, restore_cache_manager: None
+) -> None:
+    cache.CacheManager.from_config(
+        {"backend": "file", "directory": str(tmp_path), "ttl": 5}
+    )
+    backend = cache.CacheManager._backend
+    assert isinstance(backend, cache.TieredCache)
+    assert isinstance(backend.backend, cache.FileCache)
+    assert backend.max_age == 5
+
+    cache.CacheManager.from_config(
+        {"backend": "file", "directory": str(tmp_path), "ttl": 5}
+    )
+    assert cache.CacheManager._backend is backend
+    cache.CacheManager.from_config(
+        {"backend": "file", "directory": str(tmp_path), "ttl": 6}
+    )
+    assert cache.CacheManager._backend is not backend
+
+
+def test_cache_manager_binds_backend_methods(restore_cache_manager: None) -> None:
+    inner = cache.InMemoryCache()
+    calls = []
+
+    def record_set(key: str, value: Any, ttl: Optional[int] = None) -> None:
+        calls.append((key, value, ttl))
+
+    inner.set = record_set  # type: ignore[method-assign]
+    cache.CacheManager.configure(inner, ttl=60)
+    assert cache.CacheManager.get == inner.get
+
+    cache.CacheManager.set("a", 1)
+    cache.CacheManager.set("b", 2, ttl=5)
+    assert calls == [("a", 1, 60), ("b", 2, 5)]
+
+
+def test_load_config_reuses_parse_and_keeps_defaults_intact(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_path = tmp_path / ".zenrube.yml"
+    config_path.write_text("cache:\n  ttl: 5\n", encoding="utf-8")
+
+    parses = []
+    original_load = config.yaml.load
+    monkeypatch.setattr(
+        config.yaml,
+        "load",
+        lambda handle, Loader: parses.append(1) or original_load(handle, Loader),
+    )
+
+    first = config.load_config(config_path)
+    first["cache"]["ttl"] = 999
+    second = config.load_config(config_path)
+
+    assert second["cache"] == {"backend": "memory", "ttl": 5}
+    assert config.DEFAULT_CONFIG["cache"] == {"backend": "memory", "ttl": 300}
+    assert len(parses) == 1
+
+    cached_files = len(config._CONFIG_CACHE)
+    config_path.write_text("cache:\n  ttl: 50\n", encoding="utf-8")
+    assert config.load_config(config_path)["cache"]["ttl"] == 50
+    assert len(parses) == 2
+    assert len(config._CONFIG_CACHE) == cached_files  # replaced, not added
+
+
+def test_cache_manager_get_many_and_set_many(restore_cache_manager: None) -> None:
+    inner = CountingCache()
+    cache.CacheManager.configure(cache.TieredCache(inner), ttl=60)
+    cache.CacheManager.set_many({"a": 1, "b": 2})
+    inner.set("c", 3)
+
+    found = cache.CacheManager.get_many(["a", "b", "c", "missing"])
+    assert found == {"a": 1, "b": 2, "c": 3}
+    assert inner.reads == 2  # only "c" and "missing" reached the backend
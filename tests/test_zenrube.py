@@ -8,19 +8,44 @@ import zenrube
 from zenrube.models import SYNTHESIS_STYLES
 
 
+ORCHESTRATION_PREFIX = "You are orchestrating"
+
+
 def _mock_response(style: str) -> Tuple[str, Dict[str, Any]]:
     return (f"{style} consensus", {"stage": "synthesis"})
 
 
+@pytest.fixture
+def mock_llm_factory():
+    """Build ``invoke_llm`` side effects from a ``{prompt prefix: response}`` table.
+
+    Prefixes are tried in insertion order, so ``""`` works as a catch-all
+    when listed last. A response is either a ``(text, metadata)`` tuple or
+    a callable that receives the prompt and returns one.
+    """
+
+    def factory(routes: Dict[str, Any]):
+        # Prefix lengths are computed once so each call is a slice compare
+        table = tuple((prefix, len(prefix), response) for prefix, response in routes.items())
+
+        def side_effect(prompt: str, **_: Any):
+            for prefix, size, response in table:
+                if prompt[:size] == prefix:
+                    return response(prompt) if callable(response) else response
+            raise AssertionError(f"Unexpected prompt: {prompt[:40]!r}")
+
+        return side_effect
+
+    return factory
+
+
 @pytest.mark.parametrize("style", SYNTHESIS_STYLES)
 @patch("zenrube.invoke_llm")
-def test_consensus_styles(mock_llm, style):
-    def side_effect(prompt: str, **_: Any):
-        if prompt.startswith("You are orchestrating"):
-            return _mock_response(style)
-        return (f"{style} expert", {"stage": "analysis"})
-
-    mock_llm.side_effect = side_effect
+def test_consensus_styles(mock_llm, style, mock_llm_factory):
+    mock_llm.side_effect = mock_llm_factory({
+        ORCHESTRATION_PREFIX: _mock_response(style),
+        "": (f"{style} expert", {"stage": "analysis"}),
+    })
     result = zenrube.zen_consensus(
         "Should we adopt event-driven architecture?",
         synthesis_style=style,
@@ -35,13 +60,11 @@ def test_consensus_styles(mock_llm, style):
 
 
 @patch("zenrube.invoke_llm")
-def test_parallel_execution(mock_llm):
-    def side_effect(prompt: str, **_: Any):
-        if prompt.startswith("You are orchestrating"):
-            return ("Parallel consensus", {"stage": "synthesis"})
-        return (prompt.split("\n")[0], {"stage": "analysis"})
-
-    mock_llm.side_effect = side_effect
+def test_parallel_execution(mock_llm, mock_llm_factory):
+    mock_llm.side_effect = mock_llm_factory({
+        ORCHESTRATION_PREFIX: ("Parallel consensus", {"stage": "synthesis"}),
+        "": lambda prompt: (prompt.split("\n")[0], {"stage": "analysis"}),
+    })
     result = zenrube.zen_consensus(
         "How should we roll out feature flags?",
         synthesis_style="collaborative",
@@ -55,16 +78,17 @@ def test_parallel_execution(mock_llm):
 
 
 @patch("zenrube.invoke_llm")
-def test_sequential_execution(mock_llm):
+def test_sequential_execution(mock_llm, mock_llm_factory):
     call_order = []
 
-    def side_effect(prompt: str, **_: Any):
-        if prompt.startswith("You are orchestrating"):
-            return ("Sequential consensus", {"stage": "synthesis"})
+    def expert(prompt: str):
         call_order.append(prompt)
         return (prompt, {"stage": "analysis"})
 
-    mock_llm.side_effect = side_effect
+    mock_llm.side_effect = mock_llm_factory({
+        ORCHESTRATION_PREFIX: ("Sequential consensus", {"stage": "synthesis"}),
+        "": expert,
+    })
     result = zenrube.zen_consensus(
         "How do we design our deployment pipeline?",
         parallel=False,
@@ -77,19 +101,20 @@ def test_sequential_execution(mock_llm):
 
 
 @patch("zenrube.invoke_llm")
-def test_degraded_mode(mock_llm):
+def test_degraded_mode(mock_llm, mock_llm_factory):
     call_count = 0
 
-    def side_effect(prompt: str, **_: Any):
+    def expert(prompt: str):
         nonlocal call_count
-        if prompt.startswith("You are orchestrating"):
-            return ("Recovered consensus", {"stage": "synthesis"})
         call_count += 1
         if call_count == 2:
             raise RuntimeError("LLM timeout")
         return (f"Expert {call_count}", {"stage": "analysis"})
 
-    mock_llm.side_effect = side_effect
+    mock_llm.side_effect = mock_llm_factory({
+        ORCHESTRATION_PREFIX: ("Recovered consensus", {"stage": "synthesis"}),
+        "": expert,
+    })
     result = zenrube.zen_consensus(
         "How do we secure our APIs?",
         synthesis_style="balanced",
@@ -106,13 +131,11 @@ def test_degraded_mode(mock_llm):
 
 
 @patch("zenrube.invoke_llm")
-def test_output_structure(mock_llm):
-    def side_effect(prompt: str, **_: Any):
-        if prompt.startswith("You are orchestrating"):
-            return ("Structured consensus", {"stage": "synthesis"})
-        return ("Structured response", {"stage": "analysis"})
-
-    mock_llm.side_effect = side_effect
+def test_output_structure(mock_llm, mock_llm_factory):
+    mock_llm.side_effect = mock_llm_factory({
+        ORCHESTRATION_PREFIX: ("Structured consensus", {"stage": "synthesis"}),
+        "": ("Structured response", {"stage": "analysis"}),
+    })
     result = zenrube.zen_consensus(
         "Should we use microservices?",
         synthesis_style="critical",
@@ -13,7 +13,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from zenrube.cache import CacheManager, build_cache_key
-from zenrube.config import build_synthesis_config, load_config
+from zenrube.config import apply_config, build_synthesis_config, load_config
 from zenrube.experts_module import ExpertDefinition, get_expert, list_experts
 from zenrube.models import (
     ConsensusResult,
@@ -35,6 +35,7 @@ __all__ = [
     "ProviderRegistry",
     "RubeProvider",
     "SYNTHESIS_STYLES",
+    "apply_config",
     "build_cache_key",
     "build_synthesis_config",
     "configure_logging",
@@ -234,6 +235,7 @@ def zen_consensus(
 ) -> Dict[str, Any]:
     execution_id = str(uuid.uuid4())
     base_config = load_config()
+    apply_config(base_config)
     CacheManager.from_config(base_config.get("cache", {}))
 
     config_overrides: Dict[str, Any] = overrides.copy() if overrides else {}
@@ -252,7 +254,7 @@ def zen_consensus(
     if debug is not None:
         config_overrides["debug"] = debug
 
-    synthesis_config = build_synthesis_config(config_overrides)
+    synthesis_config = build_synthesis_config(config_overrides, base_config=base_config)
     configure_logging(synthesis_config.logging_level, synthesis_config.debug)
     LOGGER.info("[%s] Starting consensus run", execution_id)
 
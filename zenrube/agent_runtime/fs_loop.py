@@ -1,66 +1,78 @@
 # zenrube/agent_runtime/fs_loop.py
 
 import os
+import re
 import json
-from typing import Dict, Any
+import functools
+from typing import Dict, Any, Optional
 
 from zenrube.experts.chatgpt_fs_agent import ChatGPTFsAgent, MCPFilesystemClient
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _dumps_compact(obj: Any) -> str:
+    """Serialize to compact JSON, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
 
 # ---------------------------------------------------------
 #  LLM CLIENT (LAZY LOADED)
 # ---------------------------------------------------------
 
-_mistral_client = None
+class DummyPlanner:
+    """Planner used when no MISTRAL_API_KEY is configured; never plans tasks."""
 
-def get_llm_client():
-    global _mistral_client
+    def plan(self, goal: str, observation: Dict[str, Any]):
+        return {
+            "tasks": [],
+            "meta": {
+                "planner": "disabled",
+                "reason": "MISTRAL_API_KEY missing"
+            }
+        }
 
-    if _mistral_client is not None:
-        return _mistral_client
 
+@functools.lru_cache(maxsize=1)
+def get_llm_client():
+    # Resolved once per process; call get_llm_client.cache_clear() after
+    # changing MISTRAL_API_KEY.
     api_key = os.getenv("MISTRAL_API_KEY")
 
     if not api_key:
-        class DummyPlanner:
-            def plan(self, goal: str, observation: Dict[str, Any]):
-                return {
-                    "tasks": [],
-                    "meta": {
-                        "planner": "disabled",
-                        "reason": "MISTRAL_API_KEY missing"
-                    }
-                }
-        _mistral_client = DummyPlanner()
-        return _mistral_client
+        return DummyPlanner()
 
     from mistralai import Mistral
-    _mistral_client = Mistral(api_key=api_key)
-    return _mistral_client
+    return Mistral(api_key=api_key)
 
 
 # ---------------------------------------------------------
 #  PROMPT BUILDER
 # ---------------------------------------------------------
 
-def build_planner_prompt(goal: str, observation: Dict[str, Any]) -> str:
-    return f"""
+_PROMPT_HEADER = """
 You are the ZenRube FS-Agent filesystem planner.
 Return ONLY JSON:
 
-{{
+{
   "tasks": [
-    {{
+    {
       "op": "list" | "read" | "write" | "delete" | "move",
       "path": "string",
       "content": "string (optional)",
       "dest": "string (optional)"
-    }}
+    }
   ],
-  "meta": {{
+  "meta": {
     "reason": "string"
-  }}
-}}
+  }
+}
 
 Rules:
 - Stay inside /workspaces/ZenRube
@@ -68,24 +80,42 @@ Rules:
 - No markdown. No backticks. JSON ONLY.
 
 GOAL:
-{goal}
-
-OBSERVATION:
-{json.dumps(observation, indent=2)}
 """
 
 
+def build_planner_prompt(
+    goal: str,
+    observation: Dict[str, Any],
+    observation_json: Optional[str] = None,
+) -> str:
+    # Compact JSON: the model does not need pretty-printed input.
+    # Callers that already serialized the observation pass it in directly.
+    if observation_json is None:
+        observation_json = _dumps_compact(observation)
+    return f"{_PROMPT_HEADER}{goal}\n\nOBSERVATION:\n{observation_json}\n"
+
+
 # ---------------------------------------------------------
 #  CALL MISTRAL (WITH FENCE CLEANUP)
 # ---------------------------------------------------------
 
-def call_fs_planner_llm(goal: str, observation: Dict[str, Any]) -> Dict[str, Any]:
+_JSON_DECODER = json.JSONDecoder()
+
+# ```json / ``` fences and stray backticks, removed in a single pass
+_FENCE_RE = re.compile(r"```(?:json)?|`")
+
+
+def call_fs_planner_llm(
+    goal: str,
+    observation: Dict[str, Any],
+    observation_json: Optional[str] = None,
+) -> Dict[str, Any]:
     client = get_llm_client()
 
-    if client.__class__.__name__ == "DummyPlanner":
+    if isinstance(client, DummyPlanner):
         return client.plan(goal, observation)
 
-    prompt = build_planner_prompt(goal, observation)
+    prompt = build_planner_prompt(goal, observation, observation_json)
 
     resp = client.chat.complete(
         model="mistral-small-latest",
@@ -96,20 +126,22 @@ def call_fs_planner_llm(goal: str, observation: Dict[str, Any]) -> Dict[str, Any
 
     content = resp.choices[0].message.content
 
+    raw = content if isinstance(content, str) else _dumps_compact(content)
+
+    # Fast path: decode the first JSON object in place, ignoring any
+    # surrounding fences or prose without rewriting the string
+    start = raw.find("{")
+    if start != -1:
+        try:
+            plan, _ = _JSON_DECODER.raw_decode(raw, start)
+            return plan
+        except json.JSONDecodeError:
+            pass
+
     # ---------------------------------------------------------
     # CLEANUP: remove fenced code blocks
     # ---------------------------------------------------------
-    raw = content if isinstance(content, str) else json.dumps(content)
-    cleaned = raw.strip()
-
-    # Remove ```json ... ```
-    if cleaned.startswith("```"):
-        cleaned = cleaned.replace("```json", "")
-        cleaned = cleaned.replace("```", "")
-        cleaned = cleaned.strip()
-
-    # Remove stray backticks anywhere
-    cleaned = cleaned.replace("```", "").replace("`", "").strip()
+    cleaned = _FENCE_RE.sub("", raw).strip()
 
     # Attempt JSON load
     try:
@@ -137,36 +169,45 @@ class FsAgentLoop:
         self.client = MCPFilesystemClient()
         self.agent = ChatGPTFsAgent(self.client, root)
 
+        # Without an API key the planner never returns tasks; detect that once
+        self._planner = get_llm_client()
+        self._planner_disabled = isinstance(self._planner, DummyPlanner)
+
+    def _no_tasks_result(self, step: int, plan: Dict[str, Any], history: list) -> Dict[str, Any]:
+        history.append({
+            "step": step,
+            "plan": plan,
+            "execution": {"ok": True, "note": "No tasks returned"}
+        })
+
+        return {
+            "ok": True,
+            "steps": step + 1,
+            "history": history,
+            "final_state": {"note": "Planner returned no tasks"}
+        }
+
     def run(self, goal: str) -> Dict[str, Any]:
         history = []
         observation: Dict[str, Any] = {}
 
+        if self._planner_disabled:
+            return self._no_tasks_result(0, self._planner.plan(goal, observation), history)
+
         for step in range(self.max_steps):
 
             # 1. Ask planner
-            plan = call_fs_planner_llm(goal, observation)
-            plan = json.loads(json.dumps(plan))  # JSON-safe
+            # Planner output comes from json.loads, so it is already JSON-safe.
+            plan = call_fs_planner_llm(goal, observation, _dumps_compact(observation))
 
             tasks = plan.get("tasks", [])
 
             # stop if empty
             if not tasks:
-                history.append({
-                    "step": step,
-                    "plan": plan,
-                    "execution": {"ok": True, "note": "No tasks returned"}
-                })
-
-                return json.loads(json.dumps({
-                    "ok": True,
-                    "steps": step + 1,
-                    "history": history,
-                    "final_state": {"note": "Planner returned no tasks"}
-                }))
+                return self._no_tasks_result(step, plan, history)
 
             # 2. Execute tasks via FS agent
             exec_result = self.agent.handle_plan(tasks)
-            exec_result = json.loads(json.dumps(exec_result))  # JSON-safe
 
             history.append({
                 "step": step,
@@ -178,17 +219,17 @@ class FsAgentLoop:
 
             # Optional completion flag
             if exec_result.get("ok") and exec_result.get("complete"):
-                return json.loads(json.dumps({
+                return {
                     "ok": True,
                     "steps": step + 1,
                     "history": history,
                     "final_state": exec_result
-                }))
+                }
 
         # Max steps reached
-        return json.loads(json.dumps({
+        return {
             "ok": False,
             "steps": self.max_steps,
             "history": history,
             "final_state": {"error": "Max steps reached"}
-        }))
+        }
@@ -2,11 +2,43 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+import functools
+from typing import Any, Dict, Tuple
 
 from zenrube.experts.chatgpt_fs_agent import ChatGPTFsAgent, MCPFilesystemClient
 
 
+@functools.lru_cache(maxsize=8)
+def _get_agent(
+    root: str, allow_delete: bool, allow_move: bool
+) -> Tuple[MCPFilesystemClient, ChatGPTFsAgent]:
+    """
+    Return a shared filesystem client and agent for the given settings.
+
+    The pair lives for the whole process and is reused across
+    autonomous-loop calls. State shared between calls:
+
+    - the client's ``_known_dirs``, the parent directories it has already
+      created. An entry goes stale if something else removes that
+      directory; writes and moves then hit FileNotFoundError, forget the
+      entry and recreate the directory, so stale entries cost a retry
+      rather than a failure.
+    - the agent's resolved sandbox root (``_root_real``), fixed when the
+      agent is built. If ``root`` is a symlink that is later repointed,
+      the sandbox keeps the original target.
+
+    Path resolution is cached per plan only, so nothing else carries over.
+    """
+    client = MCPFilesystemClient()
+    agent = ChatGPTFsAgent(
+        client=client,
+        root=root,
+        allow_delete=allow_delete,
+        allow_move=allow_move,
+    )
+    return client, agent
+
+
 def execute_fs_plan_locally(plan: Dict[str, Any]) -> Dict[str, Any]:
     """
     Execute a filesystem plan locally using the existing ChatGPTFsAgent.
@@ -20,14 +52,8 @@ def execute_fs_plan_locally(plan: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Execution result from the ChatGPTFsAgent
     """
-    # Create a filesystem client and agent
-    client = MCPFilesystemClient()
-    agent = ChatGPTFsAgent(
-        client=client,
-        root="/workspaces/ZenRube",
-        allow_delete=True,  # Allow deletes in autonomous mode
-        allow_move=True,    # Allow moves
-    )
+    # Allow deletes and moves in autonomous mode
+    _, agent = _get_agent("/workspaces/ZenRube", allow_delete=True, allow_move=True)
     
     # Execute the plan
     return agent.handle_plan(plan["tasks"], plan_meta=plan.get("meta", {}))
\ No newline at end of file
@@ -2,18 +2,85 @@
 
 from __future__ import annotations
 
-import hashlib
+import functools
 import json
 import logging
+import os
 import re
 import threading
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
 from pathlib import Path
-from typing import Any, Dict, Optional, cast
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple
 
 LOGGER = logging.getLogger("zenrube.cache")
 
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+# File and Redis payloads use msgpack when msgspec is installed, JSON otherwise.
+if msgspec is not None:
+    _encode = msgspec.msgpack.Encoder().encode
+    _decode = msgspec.msgpack.Decoder().decode
+    _DECODE_ERRORS: tuple[type[Exception], ...] = (msgspec.DecodeError, ValueError)
+    _FILE_SUFFIX = ".msgpack"
+else:
+
+    def _encode(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _decode = json.loads
+    _DECODE_ERRORS = (ValueError,)
+    _FILE_SUFFIX = ".json"
+
+# Redis values have no file suffix to mark their format, so msgpack payloads
+# start with this byte, which no JSON text can begin with. Untagged values
+# are JSON, whether written before msgpack support or without msgspec.
+_REDIS_MSGPACK_TAG = b"\x00"
+
+
+def _encode_redis(obj: Any) -> bytes:
+    if msgspec is not None:
+        return _REDIS_MSGPACK_TAG + _encode(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _decode_redis(raw: bytes) -> Any:
+    """Decode a Redis payload; undecodable values are returned as raw bytes."""
+    try:
+        if raw[:1] == _REDIS_MSGPACK_TAG:
+            # Unreadable without msgspec: a miss, not a cache hit on raw bytes
+            return _decode(raw[1:]) if msgspec is not None else None
+        return json.loads(raw)
+    except _DECODE_ERRORS:
+        return raw
+
+
+_UNSAFE_KEY_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+@functools.lru_cache(maxsize=4096)
+def _cache_filename(key: str) -> str:
+    """Map a cache key to a filesystem-safe, collision-resistant file name."""
+    # search() is cheaper than building a substituted copy of an already-safe key
+    safe_key = (
+        key
+        if _UNSAFE_KEY_CHARS.search(key) is None
+        else _UNSAFE_KEY_CHARS.sub("_", key)
+    )
+    if len(safe_key) > 100:
+        safe_key = safe_key[:100]
+    # Only disambiguates sanitized keys; no cryptographic strength needed
+    digest = blake2b(key.encode("utf-8"), digest_size=6).hexdigest()
+    if not safe_key:
+        safe_key = "entry"
+    return f"{safe_key}_{digest}{_FILE_SUFFIX}"
+
 
 class CacheBackend(ABC):
     @abstractmethod
@@ -24,57 +91,160 @@ class CacheBackend(ABC):
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         raise NotImplementedError
 
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Return the cached values for ``keys``, omitting misses."""
+        found = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def set_many(self, items: Mapping[str, Any], ttl: Optional[int] = None) -> None:
+        for key, value in items.items():
+            self.set(key, value, ttl)
+
+    def get_with_ttl(self, key: str) -> Tuple[Any, Optional[float]]:
+        """Return ``(value, seconds until the entry expires)``.
+
+        The lifetime is None for entries that never expire. Backends that
+        cannot report an entry's expiry return 0, so a tier in front of
+        them does not keep the value.
+        """
+        return self.get(key), 0.0
+
+    def get_many_with_ttl(
+        self, keys: Iterable[str]
+    ) -> Dict[str, Tuple[Any, Optional[float]]]:
+        """Like ``get_many`` but with each value's remaining lifetime."""
+        found = {}
+        for key in keys:
+            value, remaining = self.get_with_ttl(key)
+            if value is not None:
+                found[key] = (value, remaining)
+        return found
+
+
+_NS_PER_SECOND = 1_000_000_000
+
 
 class InMemoryCache(CacheBackend):
+    """Process-local cache; expiries are ``time.monotonic_ns()`` deadlines."""
+
+    # Seconds between sweeps that drop all expired entries in one pass
+    sweep_interval: float = 30.0
+
     def __init__(self) -> None:
-        self._store: Dict[str, tuple[Any, Optional[float]]] = {}
+        self._store: Dict[str, tuple[Any, Optional[int]]] = {}
         self._lock = threading.Lock()
+        self._next_sweep = 0
 
     def get(self, key: str) -> Any:
-        with self._lock:
-            if key not in self._store:
-                return None
-            value, expiry = self._store[key]
-            if expiry and expiry < time.time():
-                del self._store[key]
-                return None
-            return value
+        # A single dict lookup is atomic, so reads never take the lock.
+        # Expired entries are left for the next sweep to reclaim.
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        value, expiry = entry
+        if expiry and expiry < time.monotonic_ns():
+            return None
+        return value
+
+    def get_with_ttl(self, key: str) -> Tuple[Any, Optional[float]]:
+        entry = self._store.get(key)
+        if entry is None:
+            return None, None
+        value, expiry = entry
+        if not expiry:
+            return value, None
+        remaining = expiry - time.monotonic_ns()
+        if remaining < 0:
+            return None, None
+        return value, remaining / _NS_PER_SECOND
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        now = time.monotonic_ns()
+        store = self._store
+        found = {}
+        for key in keys:
+            entry = store.get(key)
+            if entry is not None and (not entry[1] or entry[1] >= now):
+                found[key] = entry[0]
+        return found
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
-        expiry = time.time() + ttl if ttl else None
+        now = time.monotonic_ns()
+        with self._lock:
+            self._put(key, value, now + ttl * _NS_PER_SECOND if ttl else None, now)
+
+    def set_many(self, items: Mapping[str, Any], ttl: Optional[int] = None) -> None:
+        now = time.monotonic_ns()
+        expiry = now + ttl * _NS_PER_SECOND if ttl else None
         with self._lock:
-            self._store[key] = (value, expiry)
+            for key, value in items.items():
+                self._put(key, value, expiry, now)
+
+    def _put(self, key: str, value: Any, expiry: Optional[int], now: int) -> None:
+        """Store one entry, sweeping if one is due. Caller must hold the lock."""
+        self._store[key] = (value, expiry)
+        if now >= self._next_sweep:
+            self._sweep(now)
+            self._next_sweep = now + int(self.sweep_interval * _NS_PER_SECOND)
+
+    def _sweep(self, now: int) -> None:
+        """Remove every expired entry. Caller must hold the lock."""
+        expired = [
+            key for key, (_, expiry) in self._store.items() if expiry and expiry < now
+        ]
+        for key in expired:
+            del self._store[key]
+
+
+# Background writer shared by all FileCache instances
+_WRITER = ThreadPoolExecutor(max_workers=2, thread_name_prefix="zenrube-cache")
 
 
 class FileCache(CacheBackend):
     def __init__(self, directory: Path) -> None:
         self.directory = directory
         self.directory.mkdir(parents=True, exist_ok=True)
+        # Encoded entries not yet on disk; reads see them immediately and
+        # repeated sets of one key coalesce into a single write.
+        self._pending: Dict[Path, bytes] = {}
+        self._pending_lock = threading.Lock()
+        # Names of entry files known to exist, scanned once here and kept up
+        # to date by this instance, so a miss costs no stat call. Entries
+        # written by other processes after start-up are not seen.
+        self._present = {entry.name for entry in os.scandir(directory)}
 
     def _path(self, key: str) -> Path:
-        safe_key = re.sub(r"[^A-Za-z0-9_.-]", "_", key)
-        if len(safe_key) > 100:
-            safe_key = safe_key[:100]
-        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:12]
-        if not safe_key:
-            safe_key = "entry"
-        return self.directory / f"{safe_key}_{digest}.json"
+        return self.directory / _cache_filename(key)
 
     def get(self, key: str) -> Any:
-        path = self._path(key)
-        if not path.exists():
-            return None
+        return self.get_with_ttl(key)[0]
+
+    def get_with_ttl(self, key: str) -> Tuple[Any, Optional[float]]:
+        filename = _cache_filename(key)
+        path = self.directory / filename
+        data = self._pending.get(path)
+        if data is None and filename not in self._present:
+            return None, None
         try:
-            with path.open("r", encoding="utf-8") as handle:
-                payload = json.load(handle)
+            payload = _decode(data if data is not None else path.read_bytes())
             expires_at = payload.get("expires_at")
-            if expires_at and expires_at < time.time():
+            if not expires_at:
+                return payload.get("value"), None
+            remaining = expires_at - time.time()
+            if remaining < 0:
+                with self._pending_lock:
+                    self._pending.pop(path, None)
+                    self._present.discard(filename)
                 path.unlink(missing_ok=True)
-                return None
-            return payload.get("value")
+                return None, None
+            return payload.get("value"), remaining
         except Exception as exc:  # pragma: no cover - logging side effect
             LOGGER.warning("Failed reading cache file %s: %s", path, exc)
-            return None
+            return None, None
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         path = self._path(key)
@@ -83,10 +253,42 @@ class FileCache(CacheBackend):
             "expires_at": time.time() + ttl if ttl else None,
         }
         try:
-            with path.open("w", encoding="utf-8") as handle:
-                json.dump(payload, handle)
+            data = _encode(payload)
+        except Exception as exc:  # pragma: no cover
+            LOGGER.warning("Failed encoding cache entry %s: %s", path, exc)
+            return
+        with self._pending_lock:
+            queued = path in self._pending
+            self._pending[path] = data
+            self._present.add(path.name)
+        if not queued:
+            _WRITER.submit(self._write_pending, path)
+
+    def flush(self) -> None:
+        """Write every pending entry to disk before returning."""
+        for path in list(self._pending):
+            self._write_pending(path)
+
+    def _write_pending(self, path: Path) -> None:
+        data = self._pending.get(path)
+        if data is None:
+            return
+        # Per-thread temp file + os.replace: readers never see a partial file
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        try:
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
         except Exception as exc:  # pragma: no cover
             LOGGER.warning("Failed writing cache file %s: %s", path, exc)
+            tmp.unlink(missing_ok=True)
+        with self._pending_lock:
+            if self._pending.get(path) is data:
+                del self._pending[path]
+                return
+            newer = path in self._pending
+        if newer:
+            # A set arrived while writing; write its payload too.
+            _WRITER.submit(self._write_pending, path)
 
 
 class RedisCache(CacheBackend):
@@ -101,24 +303,166 @@ class RedisCache(CacheBackend):
         value = self._client.get(key)
         if value is None:
             return None
-        try:
-            return json.loads(value)
-        except json.JSONDecodeError:
-            return value
+        return _decode_redis(value)
+
+    def get_with_ttl(self, key: str) -> Tuple[Any, Optional[float]]:  # pragma: no cover
+        found = self.get_many_with_ttl([key])
+        return found.get(key, (None, None))
 
     def set(
         self, key: str, value: Any, ttl: Optional[int] = None
     ) -> None:  # pragma: no cover
-        payload = json.dumps(value)
+        payload = _encode_redis(value)
         if ttl:
             self._client.setex(key, ttl, payload)
         else:
             self._client.set(key, payload)
 
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:  # pragma: no cover
+        keys = list(keys)
+        if not keys:
+            return {}
+        found = {}
+        # One MGET round-trip for all keys
+        for key, raw in zip(keys, self._client.mget(keys)):
+            value = None if raw is None else _decode_redis(raw)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def get_many_with_ttl(
+        self, keys: Iterable[str]
+    ) -> Dict[str, Tuple[Any, Optional[float]]]:  # pragma: no cover
+        keys = list(keys)
+        if not keys:
+            return {}
+        # MGET plus one PTTL per key, all in one round-trip
+        pipe = self._client.pipeline(transaction=False)
+        pipe.mget(keys)
+        for key in keys:
+            pipe.pttl(key)
+        raws, *pttls = pipe.execute()
+        found = {}
+        for key, raw, pttl in zip(keys, raws, pttls):
+            value = None if raw is None else _decode_redis(raw)
+            if value is None:
+                continue
+            # PTTL is -1 for keys without an expiry
+            found[key] = (value, pttl / 1000 if pttl >= 0 else None)
+        return found
+
+    def set_many(
+        self, items: Mapping[str, Any], ttl: Optional[int] = None
+    ) -> None:  # pragma: no cover
+        # Non-transactional pipeline: one round-trip, no MULTI/EXEC overhead
+        pipe = self._client.pipeline(transaction=False)
+        for key, value in items.items():
+            payload = _encode_redis(value)
+            if ttl:
+                pipe.setex(key, ttl, payload)
+            else:
+                pipe.set(key, payload)
+        pipe.execute()
+
+
+class TieredCache(CacheBackend):
+    """Bounded in-process LRU in front of a slower file or Redis backend."""
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        capacity: int = 1024,
+        max_age: Optional[int] = None,
+    ) -> None:
+        self.backend = backend
+        self.capacity = capacity
+        # Upper bound on how long entries populated from backend reads stay
+        # in memory; they never outlive the backend entry's own expiry.
+        self.max_age = max_age
+        self._front: OrderedDict[str, tuple[Any, Optional[int]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        value = self._get_front(key)
+        if value is not None:
+            return value
+        value, remaining = self.backend.get_with_ttl(key)
+        if value is not None:
+            self._remember_fetched(key, value, remaining)
+        return value
+
+    def _get_front(self, key: str) -> Any:
+        with self._lock:
+            entry = self._front.get(key)
+            if entry is None:
+                return None
+            value, expiry = entry
+            if not expiry or expiry >= time.monotonic_ns():
+                self._front.move_to_end(key)
+                return value
+            del self._front[key]
+            return None
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        self.backend.set(key, value, ttl)
+        self._remember(key, value, ttl)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        found = {}
+        missing = []
+        for key in keys:
+            value = self._get_front(key)
+            if value is None:
+                missing.append(key)
+            else:
+                found[key] = value
+        if missing:
+            fetched = self.backend.get_many_with_ttl(missing)
+            for key, (value, remaining) in fetched.items():
+                self._remember_fetched(key, value, remaining)
+                found[key] = value
+        return found
+
+    def set_many(self, items: Mapping[str, Any], ttl: Optional[int] = None) -> None:
+        self.backend.set_many(items, ttl)
+        for key, value in items.items():
+            self._remember(key, value, ttl)
+
+    def _remember_fetched(
+        self, key: str, value: Any, remaining: Optional[float]
+    ) -> None:
+        """Front a backend value for no longer than its remaining lifetime."""
+        if remaining is not None and remaining <= 0:
+            return
+        if self.max_age and (remaining is None or remaining > self.max_age):
+            remaining = self.max_age
+        self._remember(key, value, remaining)
+
+    def _remember(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        expiry = time.monotonic_ns() + int(ttl * _NS_PER_SECOND) if ttl else None
+        with self._lock:
+            self._front[key] = (value, expiry)
+            self._front.move_to_end(key)
+            if len(self._front) > self.capacity:
+                self._front.popitem(last=False)
+
 
 class CacheManager:
-    _backend: CacheBackend = cast(CacheBackend, InMemoryCache())
+    """Process-wide cache front end.
+
+    ``configure`` binds ``get``/``set``/``get_many``/``set_many`` straight to
+    the backend's methods (with the default TTL folded into the setters), so
+    a cache access is a single call into the backend.
+    """
+
+    _backend: CacheBackend
     _ttl: Optional[int] = None
+    _config_key: Optional[Tuple[Any, ...]] = None
+
+    get: Callable[[str], Any]
+    set: Callable[..., None]
+    get_many: Callable[[Iterable[str]], Dict[str, Any]]
+    set_many: Callable[..., None]
 
     @classmethod
     def configure(
@@ -128,11 +472,41 @@ class CacheManager:
     ) -> None:
         cls._backend = backend
         cls._ttl = ttl
+        cls._config_key = None
+
+        def _set(
+            key: str,
+            value: Any,
+            ttl: Optional[int] = None,
+            _set: Callable[[str, Any, Optional[int]], None] = backend.set,
+            _default: Optional[int] = ttl,
+        ) -> None:
+            _set(key, value, ttl if ttl is not None else _default)
+
+        def _set_many(
+            items: Mapping[str, Any],
+            ttl: Optional[int] = None,
+            _set_many: Callable[
+                [Mapping[str, Any], Optional[int]], None
+            ] = backend.set_many,
+            _default: Optional[int] = ttl,
+        ) -> None:
+            _set_many(items, ttl if ttl is not None else _default)
+
+        cls.get = staticmethod(backend.get)  # type: ignore[assignment]
+        cls.get_many = staticmethod(backend.get_many)  # type: ignore[assignment]
+        cls.set = staticmethod(_set)  # type: ignore[assignment]
+        cls.set_many = staticmethod(_set_many)  # type: ignore[assignment]
 
     @classmethod
     def from_config(cls, config: Dict[str, Any]) -> None:
         backend_name = config.get("backend", "memory")
         ttl = config.get("ttl")
+        # Reuse the current backend (and its warm front tier) when the
+        # settings have not changed since the last call
+        config_key = (backend_name, config.get("directory"), config.get("url"), ttl)
+        if config_key == cls._config_key:
+            return
         backend: CacheBackend
         if backend_name == "memory":
             if isinstance(cls._backend, InMemoryCache):
@@ -141,21 +515,19 @@ class CacheManager:
                 backend = InMemoryCache()
         elif backend_name == "file":
             directory = Path(config.get("directory", ".zenrube-cache"))
-            backend = FileCache(directory)
+            backend = TieredCache(FileCache(directory), max_age=ttl)
         elif backend_name == "redis":
-            backend = RedisCache(config.get("url", "redis://localhost:6379/0"))
+            backend = TieredCache(
+                RedisCache(config.get("url", "redis://localhost:6379/0")),
+                max_age=ttl,
+            )
         else:
             raise ValueError(f"Unknown cache backend: {backend_name}")
         cls.configure(backend, ttl)
+        cls._config_key = config_key
 
-    @classmethod
-    def get(cls, key: str) -> Any:
-        return cls._backend.get(key)
 
-    @classmethod
-    def set(cls, key: str, value: Any, ttl: Optional[int] = None) -> None:
-        effective_ttl = ttl if ttl is not None else cls._ttl
-        cls._backend.set(key, value, effective_ttl)
+CacheManager.configure(InMemoryCache())
 
 
 def build_cache_key(*parts: str) -> str:
@@ -9,6 +9,7 @@ Author: vladinc@gmail.com
 """
 
 import argparse
+import functools
 import json
 import os
 import sys
@@ -28,6 +29,16 @@ from zenrube.experts.expert_registry import ExpertRegistry
 from zenrube.experts.autopublisher import AutoPublisherExpert
 from zenrube.experts.version_manager import VersionManagerExpert
 
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+# Errors raised when the changelog is not valid JSON, for either decoder
+_CHANGELOG_DECODE_ERRORS = (
+    (json.JSONDecodeError, msgspec.DecodeError) if msgspec is not None else (json.JSONDecodeError,)
+)
+
 
 # CLI metadata
 CLI_METADATA = {
@@ -47,17 +58,16 @@ def list_experts() -> None:
     """
     try:
         registry = ExpertRegistry()
-        discovered_experts = registry.discover_experts()
+        all_expert_info = registry.get_all_expert_info()
         
-        if not discovered_experts:
+        if not all_expert_info:
             print("No experts found.")
             return
         
-        print(f"Available Experts ({len(discovered_experts)}):")
+        print(f"Available Experts ({len(all_expert_info)}):")
         print("-" * 60)
         
-        for expert_name in sorted(discovered_experts.keys()):
-            expert_info = registry.get_expert_info(expert_name)
+        for expert_name, expert_info in sorted(all_expert_info.items()):
             if expert_info:
                 print(f"• {expert_info['name']}")
                 print(f"  Version: {expert_info['version']}")
@@ -149,6 +159,22 @@ def autopublish() -> None:
         sys.exit(1)
 
 
+@functools.lru_cache(maxsize=1)
+def _load_changelog(path: str, mtime: float) -> List[Dict[str, Any]]:
+    """
+    Load and decode the changelog file.
+    
+    Cached on the file's modification time, so repeated reads of an
+    unchanged changelog skip the JSON decode. Uses msgspec's JSON decoder
+    when it is installed, which is considerably faster on large files.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if msgspec is not None:
+        return msgspec.json.decode(data)
+    return json.loads(data)
+
+
 def view_changelog(limit: int = 10) -> None:
     """
     View recent changelog entries.
@@ -156,6 +182,9 @@ def view_changelog(limit: int = 10) -> None:
     Reads ./zenrube_changelog.json and displays recent entries with
     timestamps, expert names, versions, and change summaries.
     
+    VersionManagerExpert appends entries in chronological order, so the
+    most recent entries are the tail of the list and no sort is needed.
+    
     Args:
         limit: Maximum number of entries to display (default: 10)
     """
@@ -166,8 +195,7 @@ def view_changelog(limit: int = 10) -> None:
         return
     
     try:
-        with open(changelog_file, 'r', encoding='utf-8') as f:
-            changelog_data = json.load(f)
+        changelog_data = _load_changelog(changelog_file, os.path.getmtime(changelog_file))
         
         if not changelog_data:
             print("No changelog entries found.")
@@ -194,7 +222,7 @@ def view_changelog(limit: int = 10) -> None:
             print(f"Author: {author}")
             print("-" * 40)
             
-    except json.JSONDecodeError as e:
+    except _CHANGELOG_DECODE_ERRORS as e:
         print(f"Error reading changelog file: {e}")
         sys.exit(1)
     except Exception as e:
@@ -214,17 +242,16 @@ def show_versions() -> None:
         
         # Get expert versions
         registry = ExpertRegistry()
-        discovered_experts = registry.discover_experts()
+        all_expert_info = registry.get_all_expert_info()
         
-        if not discovered_experts:
+        if not all_expert_info:
             print("No experts found.")
             return
         
         print("Expert Versions:")
         print("-" * 30)
         
-        for expert_name in sorted(discovered_experts.keys()):
-            expert_info = registry.get_expert_info(expert_name)
+        for expert_name, expert_info in sorted(all_expert_info.items()):
             if expert_info:
                 print(f"  {expert_info['name']}: v{expert_info['version']}")
             else:
@@ -242,15 +269,16 @@ def show_versions() -> None:
         sys.exit(1)
 
 
-def main() -> int:
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
     """
-    Main CLI entry point using argparse.
+    Build the CLI argument parser.
     
-    Sets up the argument parser with all required subcommands and
-    dispatches to the appropriate handler functions.
+    The parser is built once and reused by every main() call in the same
+    process, so subcommand and argument setup is not repeated.
     
     Returns:
-        int: Exit code (0 for success, 1 for error)
+        argparse.ArgumentParser: Parser with all subcommands registered
     """
     parser = argparse.ArgumentParser(
         description=CLI_METADATA['description'],
@@ -265,7 +293,7 @@ def main() -> int:
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
     # list subcommand
-    list_parser = subparsers.add_parser('list', help='List all available experts')
+    subparsers.add_parser('list', help='List all available experts')
     
     # run subcommand
     run_parser = subparsers.add_parser('run', help='Run a specific expert')
@@ -273,7 +301,7 @@ def main() -> int:
     run_parser.add_argument('--input', required=True, help='Input data for the expert')
     
     # autopublish subcommand
-    autopublish_parser = subparsers.add_parser('autopublish', help='Run automated publishing')
+    subparsers.add_parser('autopublish', help='Run automated publishing')
     
     # changelog subcommand
     changelog_parser = subparsers.add_parser('changelog', help='View recent changelog entries')
@@ -281,10 +309,29 @@ def main() -> int:
                                 help='Maximum number of entries to show (default: 10)')
     
     # version subcommand
-    version_parser = subparsers.add_parser('version', help='Show version information')
+    subparsers.add_parser('version', help='Show version information')
+    
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main CLI entry point using argparse.
+    
+    Parses arguments with the shared parser from _get_parser() and
+    dispatches to the appropriate handler functions.
+    
+    Args:
+        argv: Arguments to parse (default: sys.argv[1:]). Passing them
+              explicitly lets callers run the CLI in-process.
+    
+    Returns:
+        int: Exit code (0 for success, 1 for error)
+    """
+    parser = _get_parser()
     
     # Parse arguments
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
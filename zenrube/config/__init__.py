@@ -5,12 +5,14 @@ This module contains configuration utilities for the Zenrube MCP system.
 """
 
 # Import existing config functions directly
-from typing import Any, Dict, Iterable, Mapping, MutableMapping, Optional
+from typing import Any, Dict, Iterable, Mapping, MutableMapping, Optional, Tuple
+import copy
 import logging
 import os
 import yaml
 from pathlib import Path
 
+from zenrube.experts_module import ExpertDefinition, register_custom_expert
 from zenrube.models import SynthesisConfig
 
 LOGGER = logging.getLogger("zenrube.config")
@@ -29,20 +31,51 @@ CONFIG_LOCATIONS = (
     Path.home() / ".zenrube.yml",
 )
 
+_MISSING = object()
+
+# Parsed config files keyed on path, stored with the (mtime_ns, size) they were
+# parsed at; a changed file is reparsed and replaces its entry
+_CONFIG_CACHE: Dict[str, Tuple[int, int, Mapping[str, Any]]] = {}
+
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 def _deep_update(
     target: MutableMapping[str, Any], source: Mapping[str, Any]
 ) -> MutableMapping[str, Any]:
-    for key, value in source.items():
-        existing = target.get(key)
-        if isinstance(value, Mapping) and isinstance(existing, MutableMapping):
-            _deep_update(existing, value)  # type: ignore[index]
-        else:
-            target[key] = value
+    stack = [(target, source)]
+    while stack:
+        current, updates = stack.pop()
+        for key, value in updates.items():
+            existing = current.get(key, _MISSING)
+            if isinstance(value, Mapping) and isinstance(existing, MutableMapping):
+                stack.append((existing, value))
+            else:
+                current[key] = value
     return target
 
+def _read_config_file(location: Path) -> Optional[Mapping[str, Any]]:
+    """Return the parsed mapping for ``location``, or None if it does not exist."""
+    try:
+        stat = location.stat()
+    except FileNotFoundError:
+        return None
+    cache_key = str(location)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    with location.open("r", encoding="utf-8") as handle:
+        data = yaml.load(handle, Loader=_YAML_LOADER) or {}
+    if not isinstance(data, Mapping):
+        raise TypeError("Config root must be a mapping")
+    _CONFIG_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, data)
+    return data
+
 def load_config(path: Optional[os.PathLike[str]] = None) -> Dict[str, Any]:
     """Load configuration from YAML files."""
-    config: Dict[str, Any] = DEFAULT_CONFIG.copy()
+    # Deep copies keep DEFAULT_CONFIG and cached file data unmodified
+    # by the merge and by callers mutating the result.
+    config: Dict[str, Any] = copy.deepcopy(DEFAULT_CONFIG)
 
     locations: Iterable[Path]
     if path:
@@ -51,26 +84,27 @@ def load_config(path: Optional[os.PathLike[str]] = None) -> Dict[str, Any]:
         locations = CONFIG_LOCATIONS
 
     for location in locations:
-        if location.exists():
-            try:
-                with location.open("r", encoding="utf-8") as handle:
-                    data = yaml.safe_load(handle) or {}
-                    if not isinstance(data, Mapping):
-                        raise TypeError("Config root must be a mapping")
-                    _deep_update(config, data)  # type: ignore[arg-type]
-            except Exception as exc:  # pragma: no cover - logging side effect
-                LOGGER.warning(
-                    "Failed to load config from %s: %s",
-                    location,
-                    exc,
-                )
+        try:
+            data = _read_config_file(location)
+            if data is not None:
+                _deep_update(config, copy.deepcopy(data))
+        except Exception as exc:  # pragma: no cover - logging side effect
+            LOGGER.warning(
+                "Failed to load config from %s: %s",
+                location,
+                exc,
+            )
 
-    _register_configured_experts(config)
     return config
 
+def apply_config(config: Mapping[str, Any]) -> None:
+    """Apply process-wide side effects of a loaded config (custom experts).
+
+    Call once after ``load_config`` at startup rather than on every load.
+    """
+    _register_configured_experts(config)
+
 def _register_configured_experts(config: Mapping[str, Any]) -> None:
-    from zenrube.experts_module import ExpertDefinition, register_custom_expert
-    
     custom_experts = config.get("custom_experts", {})
     if not isinstance(custom_experts, Mapping):
         raise TypeError("custom_experts must be a mapping")
@@ -90,8 +124,11 @@ def _register_configured_experts(config: Mapping[str, Any]) -> None:
 
 def build_synthesis_config(
     overrides: Optional[Mapping[str, Any]] = None,
+    *,
+    base_config: Optional[Mapping[str, Any]] = None,
 ) -> SynthesisConfig:
-    base_config = load_config()
+    if base_config is None:
+        base_config = load_config()
     merged: Dict[str, Any] = {
         "synthesis_style": base_config.get("synthesis_style", "balanced"),
         "parallel_execution": base_config.get("parallel_execution", True),
@@ -122,6 +159,7 @@ from .llm_config_loader import (
 __all__ = [
     # Original config exports
     'load_config',
+    'apply_config',
     'build_synthesis_config',
     
     # LLM config exports
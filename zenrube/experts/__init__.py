@@ -5,14 +5,40 @@ This module contains expert classes that handle specific types of tasks
 within the Zenrube MCP system.
 """
 
-# Import all available experts from the experts subdirectory
-from zenrube.experts.semantic_router import SemanticRouterExpert, EXPERT_METADATA as SEMANTIC_ROUTER_METADATA
-from zenrube.experts.data_cleaner import DataCleanerExpert, EXPERT_METADATA as DATA_CLEANER_METADATA
-from zenrube.experts.summarizer import SummarizerExpert, EXPERT_METADATA as SUMMARIZER_METADATA
-from zenrube.experts.publisher import PublisherExpert, EXPERT_METADATA as PUBLISHER_METADATA
-from zenrube.experts.rube_adapter import RubeAdapterExpert, EXPERT_METADATA as RUBE_ADAPTER_METADATA
-from zenrube.experts.version_manager import VersionManagerExpert, EXPERT_METADATA as VERSION_MANAGER_METADATA
-from zenrube.experts.llm_connector import LLMConnectorExpert, EXPERT_METADATA as LLM_CONNECTOR_METADATA
+import importlib
+
+# Expert classes and metadata, imported on first access (PEP 562) so that
+# importing the package - e.g. for the registry or CLI - stays cheap
+_LAZY = {
+    "SemanticRouterExpert": ("zenrube.experts.semantic_router", "SemanticRouterExpert"),
+    "DataCleanerExpert": ("zenrube.experts.data_cleaner", "DataCleanerExpert"),
+    "SummarizerExpert": ("zenrube.experts.summarizer", "SummarizerExpert"),
+    "PublisherExpert": ("zenrube.experts.publisher", "PublisherExpert"),
+    "RubeAdapterExpert": ("zenrube.experts.rube_adapter", "RubeAdapterExpert"),
+    "VersionManagerExpert": ("zenrube.experts.version_manager", "VersionManagerExpert"),
+    "LLMConnectorExpert": ("zenrube.experts.llm_connector", "LLMConnectorExpert"),
+    "SEMANTIC_ROUTER_METADATA": ("zenrube.experts.semantic_router", "EXPERT_METADATA"),
+    "DATA_CLEANER_METADATA": ("zenrube.experts.data_cleaner", "EXPERT_METADATA"),
+    "SUMMARIZER_METADATA": ("zenrube.experts.summarizer", "EXPERT_METADATA"),
+    "PUBLISHER_METADATA": ("zenrube.experts.publisher", "EXPERT_METADATA"),
+    "RUBE_ADAPTER_METADATA": ("zenrube.experts.rube_adapter", "EXPERT_METADATA"),
+    "VERSION_MANAGER_METADATA": ("zenrube.experts.version_manager", "EXPERT_METADATA"),
+    "LLM_CONNECTOR_METADATA": ("zenrube.experts.llm_connector", "EXPERT_METADATA"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
 __all__ = [
     "SemanticRouterExpert",
@@ -29,4 +55,4 @@ __all__ = [
     "RUBE_ADAPTER_METADATA",
     "VERSION_MANAGER_METADATA",
     "LLM_CONNECTOR_METADATA"
-]
\ No newline at end of file
+]
@@ -28,8 +28,13 @@ This keeps all real file I/O local and under your control.
 
 from __future__ import annotations
 
+import asyncio
+import itertools
+import mmap
 import os
 import shutil
+import stat
+from collections import deque
 from dataclasses import dataclass
 from typing import (
     Any,
@@ -38,6 +43,8 @@ from typing import (
     Optional,
     Protocol,
     Literal,
+    Set,
+    Tuple,
 )
 
 
@@ -93,6 +100,68 @@ class FilesystemClient(Protocol):
         ...
 
 
+def _count_lines(content: str) -> int:
+    """Count lines the way ``readlines()`` would split them."""
+    if not content:
+        return 0
+    count = content.count("\n")
+    if not content.endswith("\n"):
+        count += 1
+    return count
+
+
+# Buffer size for file reads and writes: large files move in 1 MiB
+# read()/write() calls instead of the 8 KiB default.
+_IO_BUFSIZE = 1 << 20
+
+# Files larger than this are mapped for tail reads instead of being
+# streamed line by line.
+_MMAP_THRESHOLD = 1 << 20
+
+# Smallest file worth a readahead hint. Smaller files are read in a single
+# buffered read() anyway, and the hint's open/fadvise/close costs more
+# than it saves.
+_PREFETCH_MIN_BYTES = _IO_BUFSIZE
+
+
+def _read_tail_mapped(path: str, tail: int) -> Optional[Tuple[str, int, int]]:
+    """
+    Read the last ``tail`` lines of a large file through mmap.
+
+    Newlines are counted in bounded chunks of the mapping, the window start
+    is found by walking rfind() back from EOF, and only the window is
+    decoded. Returns (content, lines_returned, lines_total), or None when
+    the file is small or needs the text-mode path: a lone \r is a line
+    break under universal newlines, and invalid UTF-8 in the window keeps
+    its decode error.
+    """
+    with open(path, 'rb', buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= _MMAP_THRESHOLD:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            newlines = 0
+            for offset in range(0, size, _IO_BUFSIZE):
+                chunk = mm[offset:offset + _IO_BUFSIZE]
+                if b'\r' in chunk:
+                    return None
+                newlines += chunk.count(b'\n')
+            lines_total = newlines + (mm[size - 1] != 0x0A)
+
+            start = 0
+            if lines_total > tail:
+                pos = size - 1 if mm[size - 1] == 0x0A else size
+                for _ in range(tail):
+                    pos = mm.rfind(b'\n', 0, pos)
+                start = pos + 1
+            data = mm[start:]
+
+    try:
+        return data.decode('utf-8'), min(tail, lines_total), lines_total
+    except UnicodeDecodeError:
+        return None
+
+
 # ---------------------------------------------------------------------
 # Implementation of FilesystemClient that bridges to MCP tools
 # ---------------------------------------------------------------------
@@ -114,25 +183,51 @@ class MCPFilesystemClient(FilesystemClient):
     that's compatible with the MCP tool signatures.
     """
 
+    def __init__(self) -> None:
+        # Parent directories already created or confirmed by this client,
+        # so repeated writes into one directory skip os.makedirs
+        self._known_dirs: Set[str] = set()
+
+    def _ensure_parent(self, path: str) -> None:
+        parent = os.path.dirname(path)
+        if parent not in self._known_dirs:
+            os.makedirs(parent, exist_ok=True)
+            self._known_dirs.add(parent)
+
+    def _forget_dirs(self, path: str) -> None:
+        """Drop ``path`` and everything below it from the known directories."""
+        prefix = path.rstrip(os.sep) + os.sep
+        self._known_dirs = {
+            d for d in self._known_dirs if d != path and not d.startswith(prefix)
+        }
+
     def list_directory(self, path: str) -> Dict[str, Any]:
         """List directory contents with metadata."""
         try:
-            if not os.path.exists(path):
+            try:
+                entries = os.scandir(path)
+            except FileNotFoundError:
                 return {"error": f"Path does not exist: {path}"}
-            if not os.path.isdir(path):
+            except NotADirectoryError:
                 return {"error": f"Path is not a directory: {path}"}
-                
+
+            # scandir entries carry the file type from the directory read,
+            # so only stat() costs a syscall per entry (none for is_dir)
             items = []
-            for item in os.listdir(path):
-                full_path = os.path.join(path, item)
-                stat = os.stat(full_path)
-                items.append({
-                    "name": item,
-                    "path": full_path,
-                    "is_dir": os.path.isdir(full_path),
-                    "size": stat.st_size,
-                    "mtime": stat.st_mtime
-                })
+            with entries:
+                for entry in entries:
+                    try:
+                        entry_stat = entry.stat()
+                    except OSError:
+                        # Broken symlink: report the link itself
+                        entry_stat = entry.stat(follow_symlinks=False)
+                    items.append({
+                        "name": entry.name,
+                        "path": entry.path,
+                        "is_dir": entry.is_dir(),
+                        "size": entry_stat.st_size,
+                        "mtime": entry_stat.st_mtime
+                    })
             
             return {"ok": True, "path": path, "items": items}
         except Exception as e:
@@ -146,12 +241,59 @@ class MCPFilesystemClient(FilesystemClient):
     ) -> Dict[str, Any]:
         """Read text file content with optional line limiting."""
         try:
-            if not os.path.exists(path):
-                return {"error": f"File does not exist: {path}"}
-            if not os.path.isfile(path):
+            # One stat() before opening: open() on a FIFO or device node
+            # would block instead of failing
+            if not stat.S_ISREG(os.stat(path).st_mode):
                 return {"error": f"Path is not a file: {path}"}
-                
-            with open(path, 'r', encoding='utf-8') as f:
+
+            if head is None and tail is None:
+                # Unbounded read: one bulk read, no per-line list to re-join.
+                with open(path, 'r', encoding='utf-8', buffering=_IO_BUFSIZE) as f:
+                    content = f.read()
+                lines_total = _count_lines(content)
+                return {
+                    "ok": True,
+                    "path": path,
+                    "content": content,
+                    "lines_total": lines_total,
+                    "lines_returned": lines_total
+                }
+
+            if (head is None or head > 0) and (tail is None or tail > 0):
+                mapped = _read_tail_mapped(path, tail) if head is None else None
+                if mapped is not None:
+                    content, lines_returned, lines_total = mapped
+                    return {
+                        "ok": True,
+                        "path": path,
+                        "content": content,
+                        "lines_total": lines_total,
+                        "lines_returned": lines_returned
+                    }
+
+                # Stream the file, holding at most head/tail lines in memory.
+                # lines_total is None when reading stops after the head.
+                with open(path, 'r', encoding='utf-8', buffering=_IO_BUFSIZE) as f:
+                    if tail is None:
+                        content_lines = list(itertools.islice(f, head))
+                        lines_total = None
+                    elif head is None:
+                        window = deque(enumerate(f, 1), maxlen=tail)
+                        content_lines = [line for _, line in window]
+                        lines_total = window[-1][0] if window else 0
+                    else:
+                        content_lines = list(deque(itertools.islice(f, head), maxlen=tail))
+                        lines_total = None
+                return {
+                    "ok": True,
+                    "path": path,
+                    "content": ''.join(content_lines),
+                    "lines_total": lines_total,
+                    "lines_returned": len(content_lines)
+                }
+
+            # Zero or negative limits keep their list-slicing semantics
+            with open(path, 'r', encoding='utf-8', buffering=_IO_BUFSIZE) as f:
                 lines = f.readlines()
                 
             content_lines = lines
@@ -168,6 +310,8 @@ class MCPFilesystemClient(FilesystemClient):
                 "lines_total": len(lines),
                 "lines_returned": len(content_lines)
             }
+        except (FileNotFoundError, NotADirectoryError):
+            return {"error": f"File does not exist: {path}"}
         except Exception as e:
             return {"error": f"Failed to read file: {str(e)}"}
 
@@ -184,42 +328,87 @@ class MCPFilesystemClient(FilesystemClient):
                 return {"error": f"File already exists: {path}"}
                 
             # Ensure directory exists
-            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._ensure_parent(path)
             
-            with open(path, 'w', encoding='utf-8') as f:
+            try:
+                f = open(path, 'w', encoding='utf-8', buffering=_IO_BUFSIZE)
+            except FileNotFoundError:
+                # The parent was removed by something other than this client
+                self._known_dirs.discard(os.path.dirname(path))
+                self._ensure_parent(path)
+                f = open(path, 'w', encoding='utf-8', buffering=_IO_BUFSIZE)
+            with f:
                 f.write(content)
                 
             return {"ok": True, "path": path, "bytes_written": len(content)}
         except Exception as e:
             return {"error": f"Failed to write file: {str(e)}"}
 
+    def prefetch(self, paths: List[str]) -> None:
+        """
+        Ask the kernel to start reading ``paths`` ahead of the actual reads.
+
+        Used by ChatGPTFsAgent.handle_plan_async for plans with several
+        reads, so the disk works on all of them at once. Only regular files of at least _PREFETCH_MIN_BYTES are
+        hinted; for the rest a stat() is the whole cost. Advisory only;
+        missing paths and unsupported platforms are ignored.
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+        for path in paths:
+            try:
+                path_stat = os.stat(path)
+            except OSError:
+                continue
+            if (
+                not stat.S_ISREG(path_stat.st_mode)
+                or path_stat.st_size < _PREFETCH_MIN_BYTES
+            ):
+                continue
+            try:
+                # O_NONBLOCK keeps a FIFO swapped in since the stat from blocking
+                fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+
     def delete_path(self, path: str) -> Dict[str, Any]:
         """Delete file or directory (recursive)."""
         try:
-            if not os.path.exists(path):
-                return {"error": f"Path does not exist: {path}"}
-                
-            if os.path.isdir(path):
+            # lstat so a symlink to a directory is removed, not followed
+            if stat.S_ISDIR(os.lstat(path).st_mode):
                 shutil.rmtree(path)
+                self._forget_dirs(path)
                 return {"ok": True, "path": path, "action": "directory_deleted"}
-            else:
-                os.remove(path)
-                return {"ok": True, "path": path, "action": "file_deleted"}
+            os.remove(path)
+            return {"ok": True, "path": path, "action": "file_deleted"}
+        except (FileNotFoundError, NotADirectoryError):
+            return {"error": f"Path does not exist: {path}"}
         except Exception as e:
             return {"error": f"Failed to delete path: {str(e)}"}
 
     def move_path(self, src: str, dest: str) -> Dict[str, Any]:
         """Move/rename file or directory."""
         try:
-            if not os.path.exists(src):
-                return {"error": f"Source path does not exist: {src}"}
+            # os.replace would silently overwrite, so this check stays
             if os.path.exists(dest):
                 return {"error": f"Destination path already exists: {dest}"}
-                
-            # Ensure destination directory exists
-            os.makedirs(os.path.dirname(dest), exist_ok=True)
-            
-            os.rename(src, dest)
+
+            try:
+                os.replace(src, dest)
+            except FileNotFoundError:
+                if not os.path.lexists(src):
+                    return {"error": f"Source path does not exist: {src}"}
+                # Ensure destination directory exists
+                self._known_dirs.discard(os.path.dirname(dest))
+                self._ensure_parent(dest)
+                os.replace(src, dest)
+            self._forget_dirs(src)
             return {"ok": True, "src": src, "dest": dest, "action": "moved"}
         except Exception as e:
             return {"error": f"Failed to move path: {str(e)}"}
@@ -231,6 +420,9 @@ class MCPFilesystemClient(FilesystemClient):
 
 FsOp = Literal["list", "read", "write", "delete", "move"]
 
+# Ops that never modify the filesystem and may run concurrently
+_READ_ONLY_OPS = frozenset({"list", "read"})
+
 
 @dataclass
 class FsTask:
@@ -306,30 +498,46 @@ class ChatGPTFsAgent:
     ) -> None:
         self._client = client
         self._root = root.rstrip("/")
+        # Containment is checked on resolved paths, against the root
+        # resolved once here
+        self._root_real = os.path.realpath(self._root or os.sep)
+        self._root_prefix = self._root_real.rstrip(os.sep) + os.sep
         self._allow_delete = allow_delete
         self._allow_move = allow_move
 
     # ---------------- safety helpers ----------------
 
-    def _normalize_path(self, path: str) -> str:
+    def _normalize_path(
+        self,
+        path: str,
+        path_cache: Optional[Dict[str, str]] = None,
+    ) -> str:
         """
         Ensure path stays inside the configured root.
 
-        We do a simple, explicit check rather than clever path
-        resolution to keep behavior transparent.
+        Relative paths are joined to the root. The path is resolved with
+        os.path.realpath (so ``..`` segments and symlinks cannot lead
+        outside the root) and must equal the root or sit below it. Returns
+        the lexically normalized path, not the resolved one.
+
+        ``path_cache`` (per plan) remembers paths that already passed, so a
+        plan touching one path many times resolves it once.
         """
-        if path.startswith("/"):
-            full = path
-        else:
-            full = f"{self._root}/{path}"
+        if path_cache is not None:
+            cached = path_cache.get(path)
+            if cached is not None:
+                return cached
 
-        # crude but effective: block parent traversal attempts
-        if ".." in full:
-            raise ValueError(f"Unsafe path blocked: {path!r}")
+        full = os.path.normpath(os.path.join(self._root or os.sep, path))
+        real = os.path.realpath(full)
 
-        if not full.startswith(self._root):
+        if real != self._root_real and not real.startswith(self._root_prefix):
+            if os.pardir in path.split("/"):
+                raise ValueError(f"Unsafe path blocked: {path!r}")
             raise ValueError(f"Path escapes root sandbox: {path!r}")
 
+        if path_cache is not None:
+            path_cache[path] = full
         return full
 
     def _check_op_allowed(self, task: FsTask) -> None:
@@ -340,13 +548,44 @@ class ChatGPTFsAgent:
 
     # ---------------- execution ----------------
 
-    def execute_task(self, task: FsTask) -> Dict[str, Any]:
+    def _prefetch_reads(
+        self,
+        tasks: List[Dict[str, Any]],
+        path_cache: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Hand the plan's read targets to the client's optional ``prefetch``
+        hook before executing anything. Invalid tasks are skipped here and
+        reported when they run.
+        """
+        prefetch = getattr(self._client, "prefetch", None)
+        if prefetch is None:
+            return
+        paths = []
+        for raw in tasks:
+            if not isinstance(raw, dict) or raw.get("op") != "read":
+                continue
+            try:
+                paths.append(self._normalize_path(raw["path"], path_cache))
+            except (KeyError, TypeError, ValueError):
+                continue
+        if len(paths) > 1:
+            prefetch(paths)
+
+    def execute_task(
+        self,
+        task: FsTask,
+        path_cache: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
         """
         Execute a single FsTask through the underlying filesystem client.
         Returns a structured result payload.
+
+        ``path_cache`` is shared by the tasks of one plan; see
+        _normalize_path.
         """
         self._check_op_allowed(task)
-        safe_path = self._normalize_path(task.path)
+        safe_path = self._normalize_path(task.path, path_cache)
 
         if task.op == "list":
             result = self._client.list_directory(safe_path)
@@ -370,11 +609,15 @@ class ChatGPTFsAgent:
         elif task.op == "move":
             if not task.dest_path:
                 raise ValueError("move operation requires 'dest_path'")
-            dest = self._normalize_path(task.dest_path)
+            dest = self._normalize_path(task.dest_path, path_cache)
             result = self._client.move_path(safe_path, dest)
         else:
             raise ValueError(f"Unsupported op: {task.op!r}")
 
+        if path_cache is not None and task.op in ("delete", "move"):
+            # Moving a symlink can change where other paths resolve
+            path_cache.clear()
+
         # Check if the client operation failed
         if isinstance(result, dict) and "error" in result:
             raise RuntimeError(result["error"])
@@ -407,28 +650,73 @@ class ChatGPTFsAgent:
               "meta": {...},
             }
         """
-        results: List[Dict[str, Any]] = []
-        errors: List[Dict[str, Any]] = []
+        # No readahead hints here: for the small files typical of plans the
+        # extra syscalls per read cost more than sequential reads save.
+        path_cache: Dict[str, str] = {}
+        return self._plan_result(
+            [self._execute_raw(raw, path_cache) for raw in tasks], plan_meta
+        )
+
+    async def handle_plan_async(
+        self,
+        tasks: List[Dict[str, Any]],
+        plan_meta: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Async variant of handle_plan that overlaps independent tasks.
 
+        Consecutive read/list tasks run concurrently in worker threads;
+        write, delete and move tasks run alone, in plan order, so a task
+        always sees the effects of every mutation before it. The result
+        has the same shape and ordering as handle_plan.
+        """
+        path_cache: Dict[str, str] = {}
+        self._prefetch_reads(tasks, path_cache)
+        outcomes: List[Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]] = []
+        batch: List[Dict[str, Any]] = []
         for raw in tasks:
-            try:
-                task = FsTask.from_dict(raw)
-                res = self.execute_task(task)
-                results.append(res)
-            except Exception as exc:  # noqa: BLE001
-                errors.append(
-                    {
-                        "task": raw,
-                        "error": type(exc).__name__,
-                        "message": str(exc),
-                    }
-                )
+            if isinstance(raw, dict) and raw.get("op") in _READ_ONLY_OPS:
+                batch.append(raw)
+                continue
+            if batch:
+                outcomes.extend(await self._execute_concurrently(batch, path_cache))
+                batch = []
+            outcomes.append(await asyncio.to_thread(self._execute_raw, raw, path_cache))
+        if batch:
+            outcomes.extend(await self._execute_concurrently(batch, path_cache))
+        return self._plan_result(outcomes, plan_meta)
+
+    async def _execute_concurrently(
+        self, tasks: List[Dict[str, Any]], path_cache: Dict[str, str]
+    ) -> List[Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+        return await asyncio.gather(
+            *(asyncio.to_thread(self._execute_raw, raw, path_cache) for raw in tasks)
+        )
+
+    def _execute_raw(
+        self, raw: Dict[str, Any], path_cache: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Run one raw task, returning ``(result, None)`` or ``(None, error)``."""
+        try:
+            return self.execute_task(FsTask.from_dict(raw), path_cache), None
+        except Exception as exc:  # noqa: BLE001
+            return None, {
+                "task": raw,
+                "error": type(exc).__name__,
+                "message": str(exc),
+            }
 
-        ok = len(errors) == 0
+    @staticmethod
+    def _plan_result(
+        outcomes: List[Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]],
+        plan_meta: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        results = [res for res, _ in outcomes if res is not None]
+        errors = [err for _, err in outcomes if err is not None]
 
         return {
-            "ok": ok,
+            "ok": not errors,
             "tasks": results,
             "errors": errors,
             "meta": plan_meta or {},
-        }
\ No newline at end of file
+        }
@@ -1,8 +1,13 @@
 import json
 import csv
 import io
-import re
-from typing import Any, Union
+from typing import Any, Iterable, Tuple, Union
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 EXPERT_METADATA = {
     "name": "data_cleaner",
@@ -11,34 +16,100 @@ EXPERT_METADATA = {
     "author": "vladinc@gmail.com"
 }
 
+# Bytes outside printable ASCII, other than newline, carriage return and tab.
+# Every byte of a multi-byte UTF-8 sequence is >= 0x80, so deleting these
+# from the UTF-8 encoding drops exactly the non-printable characters.
+_NON_PRINTABLE_BYTES = bytes(
+    b for b in range(256) if not (0x20 <= b <= 0x7E or b in (0x09, 0x0A, 0x0D))
+)
 
-def detect_format(input_data: Any) -> str:
+
+def _strip_non_printable(text: str) -> str:
+    """Remove every character the cleaner treats as non-printable."""
+    return text.encode('utf-8', 'ignore').translate(None, _NON_PRINTABLE_BYTES).decode('ascii')
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON, using orjson when it is installed.
+
+    Falls back to the json module for documents orjson rejects but json
+    accepts (NaN/Infinity literals, integers wider than 64 bits), so the
+    accepted input is unchanged.
     """
-    Detects the format of the input data based on simple heuristics.
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
 
-    Args:
-        input_data: The input data to analyze (string, list, or dict).
 
-    Returns:
-        str: "csv", "json", or "text".
+# Characters a JSON document can start with, after leading whitespace
+_JSON_START = frozenset('{["-0123456789tfnNI')
+# Marks a string input that was not parsed as JSON during detection
+_NOT_PARSED = object()
+
+
+def _detect(input_data: Any) -> Tuple[str, Any]:
+    """
+    Classify ``input_data`` like detect_format, also returning the parsed
+    JSON value for JSON strings (``_NOT_PARSED`` otherwise) so the cleaner
+    does not parse the document a second time.
     """
     if isinstance(input_data, dict):
-        return "json"
+        return "json", _NOT_PARSED
     if isinstance(input_data, list):
-        return "csv"  # Assuming list represents CSV rows
+        return "csv", _NOT_PARSED  # Assuming list represents CSV rows
     if isinstance(input_data, str):
-        # Try to parse as JSON
-        try:
-            json.loads(input_data)
-            return "json"
-        except (json.JSONDecodeError, TypeError):
-            pass
+        # Only attempt a parse when the first significant character can
+        # start a JSON document
+        first = next((ch for ch in input_data if not ch.isspace()), '')
+        if first in _JSON_START:
+            try:
+                return "json", _loads(input_data)
+            except (json.JSONDecodeError, TypeError):
+                pass
         # Check for CSV-like structure (commas and newlines)
         if ',' in input_data and '\n' in input_data:
-            return "csv"
+            return "csv", _NOT_PARSED
         else:
-            return "text"
-    return "text"
+            return "text", _NOT_PARSED
+    return "text", _NOT_PARSED
+
+
+def detect_format(input_data: Any) -> str:
+    """
+    Detects the format of the input data based on simple heuristics.
+
+    Args:
+        input_data: The input data to analyze (string, list, or dict).
+
+    Returns:
+        str: "csv", "json", or "text".
+    """
+    return _detect(input_data)[0]
+
+
+def _clean_leaf(value: Any) -> Any:
+    """Clean a non-container JSON value; empty strings become None."""
+    if isinstance(value, str):
+        cleaned = _strip_non_printable(value).strip()
+        if cleaned:
+            return cleaned[0].upper() + cleaned[1:]
+        return None
+    return value
+
+
+# Exact leaf types that cleaning always keeps unchanged; checked by type
+# identity before the slower isinstance chain
+_NUMERIC_TYPES = frozenset((int, float, bool))
+
+
+def _walk_frame(container: Any, out: Any) -> Tuple[Any, Any, Any]:
+    """Stack frame for DataCleanerExpert._clean_dict."""
+    if isinstance(container, dict):
+        return iter(container.items()), out, None
+    return iter(container), out, set()
 
 
 class DataCleanerExpert:
@@ -56,20 +127,22 @@ class DataCleanerExpert:
         Returns:
             The cleaned data in the same structure as the input.
         """
-        format_type = detect_format(input_data)
+        format_type, parsed = _detect(input_data)
 
         if format_type == "json":
-            return self._clean_json(input_data)
+            return self._clean_json(input_data, parsed)
         elif format_type == "csv":
             return self._clean_csv(input_data)
         else:  # text
             return self._clean_text(input_data)
 
-    def _clean_json(self, input_data: Union[str, dict]) -> Union[str, dict]:
-        """Cleans JSON data (dict or JSON string)."""
-        if isinstance(input_data, str):
+    def _clean_json(self, input_data: Union[str, dict], parsed: Any = _NOT_PARSED) -> Union[str, dict]:
+        """Cleans JSON data (dict or JSON string), reusing ``parsed`` if given."""
+        if parsed is not _NOT_PARSED:
+            data = parsed
+        elif isinstance(input_data, str):
             try:
-                data = json.loads(input_data)
+                data = _loads(input_data)
             except (json.JSONDecodeError, TypeError):
                 return input_data  # Return as-is if not valid JSON
         else:
@@ -85,16 +158,24 @@ class DataCleanerExpert:
     def _clean_csv(self, input_data: Union[str, list]) -> Union[str, list]:
         """Cleans CSV data (string or list of rows)."""
         if isinstance(input_data, str):
+            # Rows are cleaned as the reader produces them, so the raw rows
+            # are never held in memory all at once
+            output = io.StringIO()
             try:
                 reader = csv.reader(io.StringIO(input_data))
-                rows = list(reader)
-            except Exception:
+                cleaned = self._clean_csv_text_rows(input_data, reader)
+            except csv.Error:
                 return input_data  # Return as-is if parsing fails
+            csv.writer(output).writerows(cleaned)
+            return output.getvalue()
         else:
             rows = input_data
 
         cleaned_rows = []
         seen = set()
+        # Bound methods hoisted out of the loop
+        seen_add = seen.add
+        add_row = cleaned_rows.append
 
         for row in rows:
             if isinstance(row, list):
@@ -102,100 +183,145 @@ class DataCleanerExpert:
                 cleaned_row = []
                 for cell in row:
                     if isinstance(cell, str):
-                        cell = re.sub(r'[^\x20-\x7E\n\r\t]', '', cell)  # Remove non-printable
+                        cell = _strip_non_printable(cell)  # Remove non-printable
                         cell = cell.strip()
                         if cell:  # Only add non-empty cells
-                            cell = cell[0].upper() + cell[1:] if cell else ''  # Normalize capitalization
+                            cell = cell[0].upper() + cell[1:]  # Normalize capitalization
                             cleaned_row.append(cell)
                     else:
                         cleaned_row.append(cell)
                 if cleaned_row:  # Only add non-empty rows
                     row_tuple = tuple(cleaned_row)
                     if row_tuple not in seen:
-                        seen.add(row_tuple)
-                        cleaned_rows.append(cleaned_row)
+                        seen_add(row_tuple)
+                        add_row(cleaned_row)
             else:
                 # Treat as single item
                 if isinstance(row, str):
-                    row = re.sub(r'[^\x20-\x7E\n\r\t]', '', row)
+                    row = _strip_non_printable(row)
                     row = row.strip()
                     if row:
-                        row = row[0].upper() + row[1:] if row else ''
+                        row = row[0].upper() + row[1:]
                         if row not in seen:
-                            seen.add(row)
-                            cleaned_rows.append(row)
+                            seen_add(row)
+                            add_row(row)
 
-        if isinstance(input_data, str):
-            output = io.StringIO()
-            writer = csv.writer(output)
-            writer.writerows(cleaned_rows)
-            return output.getvalue()
-        else:
-            return cleaned_rows
+        return cleaned_rows
+
+    @staticmethod
+    def _clean_csv_text_rows(text: str, rows: Iterable[list]) -> Iterable[tuple]:
+        """
+        Clean rows parsed from the CSV string ``text``, yielding unique tuples.
+
+        csv.reader yields only lists of strings, so each row is cleaned with
+        map/comprehensions instead of per-cell type checks, and the
+        non-printable filter is skipped entirely when ``text`` has nothing
+        for it to remove. Rows are deduplicated as tuples by dict.fromkeys,
+        which keeps first occurrences in order without a separate seen set.
+        Same rows as the general loop in _clean_csv.
+        """
+        filter_cells = len(_strip_non_printable(text)) != len(text)
+
+        def clean_row(row: list) -> tuple:
+            cells = map(_strip_non_printable, row) if filter_cells else row
+            # Drop empty cells and uppercase the first character of the rest
+            return tuple([cell[0].upper() + cell[1:] for cell in map(str.strip, cells) if cell])
+
+        unique = dict.fromkeys(map(clean_row, rows))
+        unique.pop((), None)  # Only add non-empty rows
+        return unique
 
     def _clean_text(self, input_data: Union[str, list]) -> Union[str, list]:
         """Cleans plain text data (string or list of strings)."""
         if isinstance(input_data, str):
             # Remove non-printable characters
-            cleaned = re.sub(r'[^\x20-\x7E\n\r\t]', '', input_data)
+            cleaned = _strip_non_printable(input_data)
             cleaned = cleaned.strip()
-            # Process each line
-            lines = cleaned.split('\n')
-            cleaned_lines = []
-            for line in lines:
-                line = line.strip()
-                if line:
-                    # Normalize capitalization: first letter uppercase
-                    line = line[0].upper() + line[1:] if line else ''
-                    cleaned_lines.append(line)
-            return '\n'.join(cleaned_lines)
+            # Strip each line, drop empty ones and uppercase the first letter
+            return '\n'.join([
+                line[0].upper() + line[1:]
+                for line in map(str.strip, cleaned.split('\n'))
+                if line
+            ])
         elif isinstance(input_data, list):
             cleaned = []
             seen = set()
+            # Bound methods hoisted out of the loop
+            seen_add = seen.add
+            add = cleaned.append
+            strip_non_printable = _strip_non_printable
             for item in input_data:
                 if isinstance(item, str):
-                    item = re.sub(r'[^\x20-\x7E\n\r\t]', '', item)
-                    item = item.strip()
+                    item = strip_non_printable(item).strip()
                     if item:
-                        item = item[0].upper() + item[1:] if item else ''
+                        item = item[0].upper() + item[1:]
                         if item not in seen:
-                            seen.add(item)
-                            cleaned.append(item)
+                            seen_add(item)
+                            add(item)
                 elif item is not None and item != '':
-                    cleaned.append(item)
+                    add(item)
             return cleaned
         else:
             return input_data
 
     def _clean_dict(self, data: Any) -> Any:
-        """Recursively cleans a dictionary or list structure."""
-        if isinstance(data, dict):
-            cleaned = {}
-            for k, v in data.items():
-                if v is not None and v != '':
-                    cleaned_k = k.strip() if isinstance(k, str) else k
-                    cleaned_v = self._clean_dict(v)
-                    if cleaned_v is not None and cleaned_v != '':
-                        cleaned[cleaned_k] = cleaned_v
-            return cleaned
-        elif isinstance(data, list):
-            cleaned = []
-            seen = set()
-            for item in data:
-                cleaned_item = self._clean_dict(item)
-                if cleaned_item is not None and cleaned_item != '':
-                    if isinstance(cleaned_item, (str, int, float, bool)):
-                        if cleaned_item not in seen:
-                            seen.add(cleaned_item)
-                            cleaned.append(cleaned_item)
+        """
+        Cleans a dictionary or list structure.
+
+        Walks nested containers with an explicit stack rather than recursion,
+        so deeply nested JSON cannot hit the recursion limit. Each cleaned
+        child container is attached to its parent when the walk enters it
+        and filled in place; cleaned containers are never dropped, so this
+        matches cleaning children before their parents.
+        """
+        if not isinstance(data, (dict, list)):
+            return _clean_leaf(data)
+
+        root: Any = {} if isinstance(data, dict) else []
+        # (remaining entries, cleaned output, seen scalars - None for dicts)
+        stack = [_walk_frame(data, root)]
+        while stack:
+            entries, out, seen = stack[-1]
+            if seen is None:
+                for key, value in entries:
+                    if isinstance(key, str):
+                        key = key.strip()
+                    if type(value) in _NUMERIC_TYPES:
+                        out[key] = value
+                    elif isinstance(value, str):
+                        value = _strip_non_printable(value).strip()
+                        if value:
+                            out[key] = value[0].upper() + value[1:]
+                    elif isinstance(value, (dict, list)):
+                        out[key] = child = {} if isinstance(value, dict) else []
+                        stack.append(_walk_frame(value, child))
+                        break
+                    elif value is not None and value != '':
+                        out[key] = value
+                else:
+                    stack.pop()
+            else:
+                for value in entries:
+                    if type(value) in _NUMERIC_TYPES:
+                        pass
+                    elif isinstance(value, str):
+                        value = _strip_non_printable(value).strip()
+                        if not value:
+                            continue
+                        value = value[0].upper() + value[1:]
+                    elif isinstance(value, (dict, list)):
+                        child = {} if isinstance(value, dict) else []
+                        out.append(child)
+                        stack.append(_walk_frame(value, child))
+                        break
+                    elif value is None or value == '':
+                        continue
+                    if isinstance(value, (str, int, float, bool)):
+                        if value not in seen:
+                            seen.add(value)
+                            out.append(value)
                     else:
-                        cleaned.append(cleaned_item)
-            return cleaned
-        elif isinstance(data, str):
-            cleaned = re.sub(r'[^\x20-\x7E\n\r\t]', '', data)
-            cleaned = cleaned.strip()
-            if cleaned:
-                cleaned = cleaned[0].upper() + cleaned[1:] if cleaned else ''
-            return cleaned if cleaned else None
-        else:
-            return data
+                        out.append(value)
+                else:
+                    stack.pop()
+        return root
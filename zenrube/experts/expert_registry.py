@@ -10,7 +10,9 @@ Author: vladinc@gmail.com
 import os
 import importlib
 import logging
-from typing import Dict, Any, List, Optional
+import stat
+from types import ModuleType
+from typing import Dict, Any, List, Optional, Tuple
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -48,6 +50,9 @@ class ExpertRegistry:
         else:
             self.experts_dir = experts_dir
         
+        # (directory mtime, expert name -> (module path, module)) from the last scan
+        self._discovery_cache: Optional[Tuple[float, Dict[str, Tuple[str, ModuleType]]]] = None
+        
         logger.info(f"ExpertRegistry initialized with experts directory: {self.experts_dir}")
     
     def discover_experts(self) -> Dict[str, str]:
@@ -59,6 +64,10 @@ class ExpertRegistry:
         module has valid EXPERT_METADATA, and returns a dict mapping expert name to 
         module path.
         
+        The result is cached per registry and reused until the directory's
+        modification time changes (i.e. an expert file is added, removed,
+        or renamed). Use clear_cache() to force a rescan.
+        
         Returns:
             Dict[str, str]: Dictionary mapping expert name to module path.
                            Example: {"data_cleaner": "zenrube.experts.data_cleaner"}
@@ -66,16 +75,34 @@ class ExpertRegistry:
         Raises:
             Exception: If directory scanning fails or critical import issues occur.
         """
-        logger.info(f"Scanning experts directory: {self.experts_dir}")
-        
-        if not os.path.exists(self.experts_dir):
+        return {
+            name: module_path
+            for name, (module_path, _) in self._discover_modules().items()
+        }
+    
+    def _discover_modules(self) -> Dict[str, Tuple[str, ModuleType]]:
+        """
+        Scan the experts directory, or reuse the cached scan, keeping the
+        imported module alongside each expert's module path.
+        """
+        # One stat() answers existence, type and mtime for the cache check
+        try:
+            dir_stat = os.stat(self.experts_dir)
+        except OSError:
             logger.error(f"Experts directory does not exist: {self.experts_dir}")
             return {}
         
-        if not os.path.isdir(self.experts_dir):
+        if not stat.S_ISDIR(dir_stat.st_mode):
             logger.error(f"Path is not a directory: {self.experts_dir}")
             return {}
         
+        mtime = dir_stat.st_mtime
+        cached = self._discovery_cache
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        logger.info(f"Scanning experts directory: {self.experts_dir}")
+        
         discovered_experts = {}
         
         try:
@@ -100,7 +127,7 @@ class ExpertRegistry:
                     if self.validate_metadata(module):
                         # Get expert name from metadata
                         expert_name = getattr(module.EXPERT_METADATA, 'name', module_name)
-                        discovered_experts[expert_name] = module_path
+                        discovered_experts[expert_name] = (module_path, module)
                         logger.info(f"Successfully discovered expert: {expert_name} ({module_path})")
                     else:
                         logger.warning(f"Skipping invalid module: {module_name}")
@@ -117,8 +144,15 @@ class ExpertRegistry:
             raise
         
         logger.info(f"Discovered {len(discovered_experts)} valid experts: {list(discovered_experts.keys())}")
+        self._discovery_cache = (mtime, discovered_experts)
         return discovered_experts
     
+    def clear_cache(self) -> None:
+        """
+        Forget the cached discovery result so the next call rescans.
+        """
+        self._discovery_cache = None
+    
     def load_expert(self, name: str) -> Any:
         """
         Dynamically loads and returns an instance of the specified expert.
@@ -136,21 +170,70 @@ class ExpertRegistry:
         """
         logger.info(f"Loading expert: {name}")
         
-        # First, discover experts to get the module path
-        discovered_experts = self.discover_experts()
+        # Expert names match their module names, so try importing the one
+        # module directly before paying for a scan of the whole directory
+        try:
+            return self.load_expert_by_name(name)
+        except ModuleNotFoundError:
+            pass
         
-        if name not in discovered_experts:
-            available_experts = list(discovered_experts.keys())
+        # Otherwise discover experts to get the module
+        module = self._get_module(name)
+        
+        if module is None:
+            available_experts = list(self._discover_modules().keys())
             raise ModuleNotFoundError(
                 f"Expert '{name}' not found. Available experts: {available_experts}"
             )
         
-        module_path = discovered_experts[name]
+        return self._instantiate_expert(name, module)
+    
+    def load_expert_by_name(self, name: str) -> Any:
+        """
+        Loads an expert by importing only ``zenrube.experts.<name>``.
+        
+        Skips directory discovery, so no other expert module is imported.
+        Only modules whose file is in this registry's experts directory
+        are loaded.
         
+        Args:
+            name (str): The name of the expert to load.
+        
+        Returns:
+            Any: An instance of the expert class.
+        
+        Raises:
+            ModuleNotFoundError: If no valid expert module has that name.
+            AttributeError: If the expert class is not found in the module.
+            Exception: If expert instantiation fails.
+        """
+        if (
+            not name.isidentifier()
+            or name in ('__init__', 'expert_registry')
+            or not os.path.isfile(os.path.join(self.experts_dir, f"{name}.py"))
+        ):
+            raise ModuleNotFoundError(f"Expert '{name}' not found")
+        
+        module_path = f"zenrube.experts.{name}"
+        module = importlib.import_module(module_path)
+        if not self.validate_metadata(module):
+            raise ModuleNotFoundError(f"Expert '{name}' not found")
+        
+        return self._instantiate_expert(name, module)
+    
+    def _get_module(self, name: str) -> Optional[ModuleType]:
+        """
+        Returns the module discovery imported for expert ``name``, or None.
+        """
+        entry = self._discover_modules().get(name)
+        return entry[1] if entry is not None else None
+    
+    def _instantiate_expert(self, name: str, module: ModuleType) -> Any:
+        """
+        Instantiates the expert class for ``name`` from its imported module.
+        """
+        module_path = module.__name__
         try:
-            # Dynamically import the module
-            module = importlib.import_module(module_path)
-            
             # Determine the expert class name (capitalize first letter of expert name)
             class_name = ''.join(word.capitalize() for word in name.split('_')) + 'Expert'
             
@@ -261,14 +344,48 @@ class ExpertRegistry:
                                     or None if expert not found.
         """
         try:
-            discovered_experts = self.discover_experts()
-            
-            if name not in discovered_experts:
-                return None
-            
-            module_path = discovered_experts[name]
-            module = importlib.import_module(module_path)
-            
+            module = self._get_module(name)
+        except Exception as e:
+            logger.error(f"Failed to get expert info for {name}: {e}")
+            return None
+        
+        if module is None:
+            return None
+        
+        return self._build_expert_info(name, module)
+    
+    def get_all_expert_info(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get detailed information about every discovered expert in one pass.
+        
+        Returns:
+            Dict[str, Optional[Dict[str, Any]]]: Expert name mapped to the same
+                                                 info dict get_expert_info() returns,
+                                                 or None if it could not be built.
+        """
+        try:
+            discovered_experts = self._discover_modules()
+        except Exception as e:
+            logger.error(f"Failed to get expert info: {e}")
+            return {}
+        
+        return {
+            name: self._build_expert_info(name, module)
+            for name, (_, module) in discovered_experts.items()
+        }
+    
+    def _build_expert_info(self, name: str, module: ModuleType) -> Optional[Dict[str, Any]]:
+        """
+        Build the info dict for an already-discovered expert.
+        
+        Args:
+            name (str): The expert name.
+            module (ModuleType): The expert's module as imported by discovery.
+        
+        Returns:
+            Optional[Dict[str, Any]]: Expert metadata and info, or None on failure.
+        """
+        try:
             if not self.validate_metadata(module):
                 return None
             
@@ -277,7 +394,7 @@ class ExpertRegistry:
                 'version': module.EXPERT_METADATA['version'],
                 'description': module.EXPERT_METADATA['description'],
                 'author': module.EXPERT_METADATA['author'],
-                'module_path': module_path,
+                'module_path': module.__name__,
                 'class_name': ''.join(word.capitalize() for word in name.split('_')) + 'Expert'
             }
             
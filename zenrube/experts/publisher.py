@@ -64,10 +64,10 @@ class PublisherExpert:
         logger.info("Generating expert manifest")
         
         try:
-            # Discover all available experts
-            discovered_experts = self.registry.discover_experts()
+            # Discover all available experts and their metadata in one pass
+            all_expert_info = self.registry.get_all_expert_info()
             
-            if not discovered_experts:
+            if not all_expert_info:
                 logger.warning("No experts discovered - manifest will be empty")
                 manifest = {
                     "manifest_version": "1.0",
@@ -78,9 +78,8 @@ class PublisherExpert:
                 # Collect metadata for each discovered expert
                 expert_metadata_list = []
                 
-                for expert_name in discovered_experts.keys():
+                for expert_name, expert_info in all_expert_info.items():
                     try:
-                        expert_info = self.registry.get_expert_info(expert_name)
                         if expert_info:
                             # Extract only the required fields for the manifest
                             expert_entry = {
@@ -15,8 +15,7 @@ from dataclasses import dataclass
 from zenrube.experts.team_council import TeamCouncil
 from zenrube.profiles.profile_controller import profile_controller
 from zenrube.profiles.personality_presets import RoastLevel
-from zenrube.profiles.personality_engine import assign_personalities, build_personality_prefix
-from zenrube.profiles.personality_safety import apply_safety_governor
+from zenrube.profiles.personality_engine import assign_personalities_with_prefixes
 
 # Simple ExpertRegistry for testing
 class ExpertRegistry:
@@ -99,26 +98,14 @@ class CouncilRunner:
         roast_level_value = profile.get("roast_level", 0)
         task_type = profile.get("task_type", "general")
         
-        # Call assign_personalities
-        personalities = assign_personalities(
+        # Assign personalities, apply safety governor and generate per-brain prefixes
+        assignments, safety_summary = assign_personalities_with_prefixes(
             profile=profile,
             domain=primary_domain,
             roast_level=roast_level_value
         )
-        
-        # Apply safety governor
-        adjusted_personalities, safety_summary = apply_safety_governor(
-            domain=primary_domain,
-            roast_level=roast_level_value,
-            task_type=task_type,
-            personalities=personalities
-        )
-        
-        # Generate per-brain prefixes
-        prefix_map = {
-            brain: build_personality_prefix(brain, cfg, task_type)
-            for brain, cfg in adjusted_personalities.items()
-        }
+        adjusted_personalities = {brain: cfg for brain, (cfg, _) in assignments.items()}
+        prefix_map = {brain: prefix for brain, (_, prefix) in assignments.items()}
         
         # Prepare council configuration with personality prefixes
         council_config = context.copy() if context else {}
@@ -5,10 +5,12 @@ Implements personality selection and assignment logic for Zenrube expert brains.
 Uses ONLY the experts and modes defined in personality_presets.py
 """
 
-from typing import Dict, Any, List, Optional
+import functools
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 
 from .personality_presets import get_personality, get_neutral_personality
+from .personality_safety import apply_safety_governor
 
 
 @dataclass
@@ -33,24 +35,27 @@ class SelectionCriteria:
         }
 
 
+# The specific alternate mode for each brain type
+_ALTERNATE_MODES = {
+    "security_analyst": "turing_strategist",
+    "pragmatic_engineer": "builder_minimalist",
+    "pattern_brain": "da_vinci_ideator",
+    "data_cleaner": "info_kondo",
+    "semantic_router": "sherlock_navigator",
+    "feelprint_brain": "jung_listener",
+    "llm_connector": "neutral_researcher"
+}
+
+
+# Pure function of hashable inputs over static presets, so results are memoized
+@functools.lru_cache(maxsize=256)
 def select_personality_mode(brain_name: str, domain: str, roast_level: int, task_type: str) -> Dict[str, Any]:
     # Get available modes for this brain
     neutral_cfg = get_neutral_personality(brain_name)
     if not neutral_cfg:
         return {}
     
-    # Get the specific alternate mode for each brain type
-    alternate_modes = {
-        "security_analyst": "turing_strategist",
-        "pragmatic_engineer": "builder_minimalist", 
-        "pattern_brain": "da_vinci_ideator",
-        "data_cleaner": "info_kondo",
-        "semantic_router": "sherlock_navigator",
-        "feelprint_brain": "jung_listener",
-        "llm_connector": "neutral_researcher"
-    }
-    
-    alternate_mode_name = alternate_modes.get(brain_name)
+    alternate_mode_name = _ALTERNATE_MODES.get(brain_name)
     alternate_cfg = get_personality(brain_name, alternate_mode_name) if alternate_mode_name else {}
     
     if not alternate_cfg:
@@ -94,24 +99,50 @@ def assign_personalities(profile: Dict[str, Any], domain: str, roast_level: int)
     experts = profile.get("experts", [])
     task_type = profile.get("task_type", "neutral")
     
-    personalities = {}
-    for brain_name in experts:
-        personality_cfg = select_personality_mode(brain_name, domain, roast_level, task_type)
-        personalities[brain_name] = personality_cfg
-    
-    return personalities
-
+    return {
+        brain_name: select_personality_mode(brain_name, domain, roast_level, task_type)
+        for brain_name in experts
+    }
 
-def build_personality_prefix(brain_name: str, personality_cfg: Dict[str, Any], task: str) -> str:
-    tone = personality_cfg.get("tone", "neutral")
-    communication_style = personality_cfg.get("communication_style", "neutral")
-    thinking_style = personality_cfg.get("thinking_style", "logical")
-    detail_level = personality_cfg.get("detail_level", 1)
-    critique_intensity = personality_cfg.get("critique_intensity", 1)
 
+@functools.lru_cache(maxsize=256)
+def _render_prefix(tone: str, communication_style: str, thinking_style: str, detail_level: int, critique_intensity: int) -> str:
     return f"[tone={tone} | style={communication_style} | thinking={thinking_style} | detail={detail_level} | critique={critique_intensity}]"
 
 
+def build_personality_prefix(brain_name: str, personality_cfg: Dict[str, Any], task: str) -> str:
+    # Configs come from a small preset pool, so rendered prefixes are cached by field values
+    return _render_prefix(
+        personality_cfg.get("tone", "neutral"),
+        personality_cfg.get("communication_style", "neutral"),
+        personality_cfg.get("thinking_style", "logical"),
+        personality_cfg.get("detail_level", 1),
+        personality_cfg.get("critique_intensity", 1),
+    )
+
+
+def assign_personalities_with_prefixes(profile: Dict[str, Any], domain: str, roast_level: int) -> Tuple[Dict[str, Tuple[Dict[str, Any], str]], Dict[str, Any]]:
+    """
+    Assign personalities, apply the safety governor and render prefixes in one call.
+
+    The safety governor needs the full assignment (its neutral fallback depends
+    on how many experts were overridden), so selection happens first and the
+    safe config and its prefix are then produced together per expert.
+
+    Returns:
+        ({brain_name: (personality_cfg, prefix)}, safety_summary)
+    """
+    task_type = profile.get("task_type", "general")
+    personalities = assign_personalities(profile, domain, roast_level)
+    safe_personalities, safety_summary = apply_safety_governor(domain, roast_level, task_type, personalities)
+
+    assignments = {
+        brain_name: (personality_cfg, build_personality_prefix(brain_name, personality_cfg, task_type))
+        for brain_name, personality_cfg in safe_personalities.items()
+    }
+    return assignments, safety_summary
+
+
 class PersonalityEngine:
     """Engine for managing personality assignments and analytics"""
 
@@ -6,7 +6,8 @@ This file uses ONLY the fields specified by the user. No additional
 fields, enums, classes, or abstractions.
 """
 
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Tuple
 from enum import Enum
 
 
@@ -186,15 +187,36 @@ PERSONALITY_PRESETS: Dict[str, Dict[str, Dict[str, Any]]] = {
 }
 
 
+# Freeze the table structure so memoized lookups can't be invalidated by
+# callers adding or replacing presets. Leaf configs stay plain dicts so
+# they remain JSON-serializable wherever they are attached to results.
+PERSONALITY_PRESETS = MappingProxyType({
+    brain_name: MappingProxyType(modes)
+    for brain_name, modes in PERSONALITY_PRESETS.items()
+})
+
+
+# Flat (brain_name, mode) view of the presets, so lookups hash once
+_FLAT_PRESETS: Dict[Tuple[str, str], Dict[str, Any]] = {
+    (brain_name, mode): cfg
+    for brain_name, modes in PERSONALITY_PRESETS.items()
+    for mode, cfg in modes.items()
+}
+
+
 # ============================================================
 # Helper functions (simple, no classes)
 # ============================================================
 
+# Hits return the shared preset dicts, which callers must not mutate.
+# Misses get a fresh dict each call, so a caller filling one in cannot
+# change what later misses return.
+
 def get_personality(brain_name: str, mode: str) -> Dict[str, Any]:
-    return PERSONALITY_PRESETS.get(brain_name, {}).get(mode, {})
+    return _FLAT_PRESETS.get((brain_name, mode), {})
 
 def get_neutral_personality(brain_name: str) -> Dict[str, Any]:
-    return PERSONALITY_PRESETS.get(brain_name, {}).get("neutral_mode", {})
+    return _FLAT_PRESETS.get((brain_name, "neutral_mode"), {})
 
 def get_default_personality(brain_name: str, domain: str) -> Dict[str, Any]:
     # For now, always return neutral_mode. Domain logic will be added in Phase 2.
@@ -29,81 +29,65 @@ class SafetyEvent:
         }
 
 
+# Generic neutral configuration used when a personality is overridden
+_NEUTRAL_OVERRIDE: Dict[str, Any] = {
+    "tone": "neutral",
+    "communication_style": "clear, structured",
+    "thinking_style": "logical",
+    "critique_intensity": 1,
+    "risk_tolerance": 1,
+    "detail_level": 2,
+    "allowed_roast": 1
+}
+
+
 def apply_safety_governor(domain: str, roast_level: int, task_type: str, personalities: Dict[str, Dict[str, Any]]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Any]]:
-    overrides_applied = 0
-    neutral_fallback_used = False
     reasons = []
     
-    adjusted_personalities = personalities.copy()
-    
     # Rule 1: Roast Clamping
-    for brain_name, personality_cfg in personalities.items():
-        if roast_level == 0:
-            adjusted_personalities[brain_name] = {
-                "tone": "neutral",
-                "communication_style": "clear, structured",
-                "thinking_style": "logical",
-                "critique_intensity": 1,
-                "risk_tolerance": 1,
-                "detail_level": 2,
-                "allowed_roast": 1
-            }
-            overrides_applied += 1
-            reasons.append(f"Forced neutral_mode for {brain_name} (roast_level=0)")
-        elif roast_level < personality_cfg.get("allowed_roast", 0):
-            adjusted_personalities[brain_name] = {
-                "tone": "neutral",
-                "communication_style": "clear, structured",
-                "thinking_style": "logical",
-                "critique_intensity": 1,
-                "risk_tolerance": 1,
-                "detail_level": 2,
-                "allowed_roast": 1
-            }
-            overrides_applied += 1
-            reasons.append(f"Clamped {brain_name} to neutral_mode (insufficient roast_level)")
+    if roast_level == 0:
+        clamped = list(personalities)
+        reasons.extend(f"Forced neutral_mode for {brain_name} (roast_level=0)" for brain_name in clamped)
+    else:
+        clamped = [
+            brain_name for brain_name, personality_cfg in personalities.items()
+            if roast_level < personality_cfg.get("allowed_roast", 0)
+        ]
+        reasons.extend(f"Clamped {brain_name} to neutral_mode (insufficient roast_level)" for brain_name in clamped)
+    overrides_applied = len(clamped)
     
-    # Rule 2: Chaos Cooling (simple version)
+    # Rule 2: Chaos Cooling (simple version) - decided once, applies to every expert
+    force_all_neutral = False
     if domain == "emotional":
-        for brain_name in adjusted_personalities:
-            adjusted_personalities[brain_name] = {
-                "tone": "neutral",
-                "communication_style": "clear, structured",
-                "thinking_style": "logical",
-                "critique_intensity": 1,
-                "risk_tolerance": 1,
-                "detail_level": 2,
-                "allowed_roast": 1
-            }
-            overrides_applied += 1
-            reasons.append("Forced neutral_mode for all experts (emotional domain)")
+        force_all_neutral = True
+        overrides_applied += len(personalities)
+        reasons.extend(["Forced neutral_mode for all experts (emotional domain)"] * len(personalities))
 
     if task_type == "sensitive":
-        for brain_name in adjusted_personalities:
-            adjusted_personalities[brain_name] = {
-                "tone": "neutral",
-                "communication_style": "clear, structured",
-                "thinking_style": "logical",
-                "critique_intensity": 1,
-                "risk_tolerance": 1,
-                "detail_level": 2,
-                "allowed_roast": 1
-            }
-            overrides_applied += 1
-            reasons.append("Forced neutral_mode for all experts (sensitive task_type)")
+        force_all_neutral = True
+        overrides_applied += len(personalities)
+        reasons.extend(["Forced neutral_mode for all experts (sensitive task_type)"] * len(personalities))
     
     # Rule 3: Neutral Fallback
-    if overrides_applied >= 2:
-        for brain_name in adjusted_personalities:
-            adjusted_personalities[brain_name] = get_neutral_personality(brain_name)
-        neutral_fallback_used = True
+    neutral_fallback_used = overrides_applied >= 2
+    if neutral_fallback_used:
+        adjusted_personalities = {brain_name: get_neutral_personality(brain_name) for brain_name in personalities}
         reasons.append("Neutral fallback triggered (2+ overrides)")
+    elif force_all_neutral:
+        adjusted_personalities = {brain_name: dict(_NEUTRAL_OVERRIDE) for brain_name in personalities}
+    else:
+        adjusted_personalities = {
+            brain_name: dict(_NEUTRAL_OVERRIDE) if brain_name in clamped else personality_cfg
+            for brain_name, personality_cfg in personalities.items()
+        }
     
     # Rule 4: Safety Summary
+    # "tones" lets callers check e.g. tones == ["neutral"] without rescanning personalities
     safety_summary = {
         "overrides_applied": overrides_applied,
         "neutral_fallback_used": neutral_fallback_used,
-        "reason": "; ".join(reasons) if reasons else "No safety overrides applied"
+        "reason": "; ".join(reasons) if reasons else "No safety overrides applied",
+        "tones": sorted({cfg.get("tone", "neutral") for cfg in adjusted_personalities.values()})
     }
     
     return adjusted_personalities, safety_summary
@@ -124,15 +108,7 @@ class SafetyGovernor:
         roast_level = getattr(criteria, 'roast_level', None)
         if roast_level == 0:
             # Get neutral mode - for simplicity, return a neutral config
-            safe_mode = {
-                "tone": "neutral",
-                "communication_style": "clear, structured",
-                "thinking_style": "logical",
-                "critique_intensity": 1,
-                "risk_tolerance": 1,
-                "detail_level": 2,
-                "allowed_roast": 1
-            }
+            safe_mode = dict(_NEUTRAL_OVERRIDE)
             was_modified = True
             events.append(SafetyEvent(
                 event_type="roast_level_zero",